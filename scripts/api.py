@@ -5,8 +5,11 @@ Provides a clean API for the council functionality, suitable for both
 CLI and web dashboard consumption.
 """
 
+import os
+import time
 import uuid
 import asyncio
+import functools
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Any, Optional, List, Callable, TYPE_CHECKING
@@ -14,7 +17,7 @@ from pathlib import Path
 from datetime import datetime
 
 from logger import logger
-from config import get_config
+from config import REPO_ROOT, get_config
 from council import CouncilOrchestrator
 from storage import ConversationStorage
 
@@ -22,6 +25,23 @@ if TYPE_CHECKING:
     from dashboard import CouncilDashboard
 
 
+def _new_conv_id() -> str:
+    """
+    Generate a time-ordered conversation ID (UUIDv7 layout).
+
+    The leading 48 bits are the Unix timestamp in milliseconds, so IDs sort
+    in creation order while keeping the standard UUID string format.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (unix_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76                       # version 7
+    value |= (rand >> 68) << 64               # rand_a (12 bits)
+    value |= 0b10 << 62                       # RFC 4122 variant
+    value |= rand & ((1 << 62) - 1)           # rand_b (62 bits)
+    return str(uuid.UUID(int=value))
+
+
 class SessionStatus(Enum):
     """Status of a council session."""
     IDLE = "idle"
@@ -76,7 +96,7 @@ class CouncilAPI:
             dashboard: Optional dashboard for live updates
         """
         if repo_root is None:
-            repo_root = Path(__file__).parent.parent
+            repo_root = REPO_ROOT
         
         self.repo_root = repo_root
         self.config = get_config()
@@ -146,6 +166,22 @@ class CouncilAPI:
         """
         return self.storage.get_conversation_by_index(index)
     
+    def get_conversation_summary(self, index: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a display summary of a conversation by its display index.
+        
+        Args:
+            index: 1-based conversation index
+            
+        Returns:
+            Conversation summary (title, created_at, per-session query and
+            chairman response) or None if not found
+        """
+        conversation_id = self.storage.get_conversation_id_by_index(index)
+        if conversation_id is None:
+            return None
+        return self.storage.get_conversation_summary(conversation_id)
+    
     def get_conversation_by_id(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a conversation by its UUID.
@@ -230,11 +266,16 @@ class CouncilAPI:
         )
         self._emit_progress(progress)
         
+        # Storage does blocking file I/O; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        
         try:
             # Get conversation history if continuing
             context_messages = []
             if conversation_id:
-                context_messages = self.storage.get_conversation_history(conversation_id)
+                context_messages = await loop.run_in_executor(
+                    None, self.storage.get_conversation_history, conversation_id
+                )
                 if context_messages:
                     logger.info(f"Continuing conversation with {len(context_messages)} previous messages")
             
@@ -255,10 +296,16 @@ class CouncilAPI:
                 self._emit_progress(progress)
                 
                 title = await self.orchestrator.generate_conversation_title(query)
-                conversation_id = str(uuid.uuid4())
-                self.storage.add_session(conversation_id, query, results, title=title)
+                conversation_id = _new_conv_id()
+                await loop.run_in_executor(
+                    None, functools.partial(
+                        self.storage.add_session, conversation_id, query, results, title=title
+                    )
+                )
             else:
-                self.storage.add_session(conversation_id, query, results)
+                await loop.run_in_executor(
+                    None, self.storage.add_session, conversation_id, query, results
+                )
             
             results["conversation_id"] = conversation_id
             
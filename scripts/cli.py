@@ -13,7 +13,8 @@ from typing import Dict, Any
 
 # Add scripts directory to path
 SCRIPTS_DIR = Path(__file__).parent
-sys.path.insert(0, str(SCRIPTS_DIR))
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
 
 from logger import logger
 from api import CouncilAPI, MergeOptions, SessionProgress, SessionStatus
@@ -160,7 +161,7 @@ def format_conversation_list(conversations: list) -> str:
 
 
 def format_conversation_detail(conversation: dict, index: int) -> str:
-    """Format a single conversation for display."""
+    """Format a single conversation summary (see get_conversation_summary) for display."""
     lines = []
     lines.append("\n" + "=" * 80)
     lines.append(f"CONVERSATION: {conversation['title']}")
@@ -171,12 +172,11 @@ def format_conversation_detail(conversation: dict, index: int) -> str:
         lines.append(f"\n--- Session {i} ({session['timestamp'][:10]}) ---")
         lines.append(f"\nQuery: {session['query']}")
         
-        results = session.get('results', {})
-        stage3 = results.get('stage3', {})
-        if stage3:
+        stage3_response = session.get('stage3_response')
+        if stage3_response is not None:
             lines.append(f"\nChairman's Synthesis:")
             lines.append("-" * 40)
-            lines.append(stage3.get('response', 'No response'))
+            lines.append(stage3_response or 'No response')
         lines.append("")
     
     lines.append("=" * 80)
@@ -242,7 +242,7 @@ def main():
     
     # Handle --show
     if args.show:
-        conversation = api.get_conversation(args.show)
+        conversation = api.get_conversation_summary(args.show)
         if conversation is None:
             logger.error(f"Conversation {args.show} not found. Use --list to see available conversations.")
             return
@@ -310,7 +310,7 @@ def main():
                 from dashboard import CouncilDashboard, create_dashboard_sink
                 from config import get_config
                 # Use the same logger instance that other modules use
-                from logger import logger as shared_logger, LOGS_DIR
+                from logger import logger as shared_logger, LOGS_DIR, add_member_log_sink
                 
                 dashboard_config = get_config()
                 dashboard = CouncilDashboard()
@@ -325,14 +325,19 @@ def main():
                     format="{time:HH:mm:ss} | {level:<8} | {message}",
                     rotation="1 day",
                     retention="7 days",
+                    delay=True,
                     filter=lambda record: "member_log" not in record["extra"],
                     enqueue=False  # Synchronous logging
                 )
                 
+                # Keep per-member log files
+                add_member_log_sink()
+                
                 # Add dashboard as a log sink (synchronous to avoid delay)
                 shared_logger.add(
                     create_dashboard_sink(dashboard),
                     level="INFO",
+                    format="{message}",  # The sink reads raw record fields
                     filter=lambda record: "member_log" not in record["extra"],
                     enqueue=False  # Ensure logs appear immediately
                 )
@@ -367,6 +372,7 @@ def main():
                 # Countdown before closing dashboard
                 timeout = dashboard_config.dashboard_timeout if dashboard_config else 5
                 dashboard.countdown_and_close(timeout)
+                dashboard.wait_until_closed()
             finally:
                 dashboard.stop()
         else:
@@ -5,8 +5,9 @@ from pathlib import Path
 from typing import List, Tuple
 from dotenv import load_dotenv
 
-# Get the scripts directory
-SCRIPTS_DIR = Path(__file__).parent
+# Get the scripts directory and the skill's repository root (resolved once)
+SCRIPTS_DIR = Path(__file__).parent.resolve()
+REPO_ROOT = SCRIPTS_DIR.parent
 ENV_PATH = SCRIPTS_DIR / ".env"
 
 # Load environment variables
@@ -45,6 +46,22 @@ def parse_provider_model(full_model: str) -> Tuple[str, str]:
         return ("opencode", full_model)
 
 
+def member_id_for(full_name: str) -> str:
+    """
+    Get the stable id for a member: dashboard key, log and worktree name.
+    
+    The readable form is kept (rather than a hash) so log files can be
+    matched to models at a glance; it is deterministic across runs.
+    
+    Args:
+        full_name: Member's provider/model string
+        
+    Returns:
+        full_name with path/drive separators replaced by underscores
+    """
+    return full_name.replace("/", "_").replace(":", "_")
+
+
 class Config:
     """Configuration for LLM Council."""
     
@@ -81,7 +98,8 @@ class Config:
             self.council_members.append({
                 "provider": provider,
                 "model": model,
-                "full_name": model_str
+                "full_name": model_str,
+                "member_id": member_id_for(model_str)
             })
         
         # Chairman model
@@ -93,7 +111,8 @@ class Config:
         self.chairman = {
             "provider": chairman_provider,
             "model": chairman_model,
-            "full_name": chairman_model_str
+            "full_name": chairman_model_str,
+            "member_id": member_id_for(chairman_model_str)
         }
         
         # Title generation model (optional, defaults to chairman model)
@@ -102,12 +121,16 @@ class Config:
         self.title_model = {
             "provider": title_provider,
             "model": title_model,
-            "full_name": title_model_str
+            "full_name": title_model_str,
+            "member_id": member_id_for(title_model_str)
         }
         
         # Dashboard settings
         self.dashboard_timeout = int(os.getenv("DASHBOARD_TIMEOUT", "5"))
         self.dashboard_refresh_rate = float(os.getenv("DASHBOARD_REFRESH_RATE", "10"))
+        
+        # Upper bound on opencode processes running at once per stage
+        self.max_concurrent_queries = max(1, int(os.getenv("MAX_CONCURRENT_QUERIES", "8")))
     
     @property
     def council_member_count(self) -> int:
@@ -10,12 +10,12 @@ from config import get_config
 from unified_client import UnifiedLLMClient
 from worktree_manager import WorktreeManager
 from prompts.templates import (
-    STAGE1_PROMPT,
-    STAGE2_RANKING_PROMPT,
-    STAGE3_SYNTHESIS_PROMPT,
-    CODE_STAGE1_PROMPT,
-    CODE_STAGE2_REVIEW_PROMPT,
-    CODE_STAGE3_SYNTHESIS_PROMPT,
+    STAGE2_RANKING,
+    STAGE3_SYNTHESIS,
+    CODE_STAGE2_REVIEW,
+    CODE_STAGE3_SYNTHESIS,
+    TITLE,
+    render_prompt,
 )
 
 
@@ -35,7 +35,11 @@ class CouncilOrchestrator:
         self.dashboard = dashboard
 
         # Use unified client (OpenCode CLI only)
-        self.client = UnifiedLLMClient(working_dir=repo_root, dashboard=dashboard)
+        self.client = UnifiedLLMClient(
+            working_dir=repo_root,
+            dashboard=dashboard,
+            max_concurrent=self.config.max_concurrent_queries,
+        )
 
         self.worktree_manager = WorktreeManager(
             repo_root=repo_root, worktrees_dir=self.config.worktrees_dir
@@ -44,9 +48,8 @@ class CouncilOrchestrator:
         # Register members with dashboard if available
         if dashboard:
             for member in self.config.get_council_members():
-                member_id = member["full_name"].replace("/", "_").replace(":", "_")
                 dashboard.register_member(
-                    member_id,
+                    member["member_id"],
                     member["full_name"],
                     member["provider"]
                 )
@@ -59,9 +62,8 @@ class CouncilOrchestrator:
         # Register members
         if dashboard:
             for member in self.config.get_council_members():
-                member_id = member["full_name"].replace("/", "_").replace(":", "_")
                 dashboard.register_member(
-                    member_id,
+                    member["member_id"],
                     member["full_name"],
                     member["provider"]
                 )
@@ -92,20 +94,15 @@ class CouncilOrchestrator:
         worktree_paths = {}
         working_dirs = {}
         if use_worktrees:
-            for i, member in enumerate(members):
-                # Replace invalid characters for Windows directory names
-                safe_model_name = (
-                    member["full_name"].replace("/", "_").replace(":", "_")
-                )
-                member_id = f"member_{i}_{safe_model_name}"
-                try:
-                    worktree_path = self.worktree_manager.create_worktree(member_id)
-                    worktree_paths[i] = (member_id, worktree_path)
-                    working_dirs[i] = worktree_path
-                except Exception as e:
-                    logger.error(
-                        f"Failed to create worktree for {member['full_name']}: {e}"
-                    )
+            # member_id has no characters invalid in Windows directory names
+            member_ids = [
+                f"member_{i}_{member['member_id']}" for i, member in enumerate(members)
+            ]
+            created = self.worktree_manager.create_worktrees_bulk(member_ids)
+            for i, member_id in enumerate(member_ids):
+                if member_id in created:
+                    worktree_paths[i] = (member_id, created[member_id])
+                    working_dirs[i] = created[member_id]
 
         # Prepare messages with context
         messages = context_messages.copy()
@@ -185,7 +182,7 @@ class CouncilOrchestrator:
                     for label, result in zip(labels, stage1_results)
                 ]
             )
-            prompt_template = CODE_STAGE2_REVIEW_PROMPT
+            prompt_template = CODE_STAGE2_REVIEW
             responses_text = responses_text.replace("Response", "Proposal")
         else:
             # Use text responses
@@ -195,10 +192,11 @@ class CouncilOrchestrator:
                     for label, result in zip(labels, stage1_results)
                 ]
             )
-            prompt_template = STAGE2_RANKING_PROMPT
+            prompt_template = STAGE2_RANKING
 
         # Build the ranking prompt
-        ranking_prompt = prompt_template.format(
+        ranking_prompt = render_prompt(
+            prompt_template,
             user_query=user_query,
             responses_text=responses_text,
             changes_text=responses_text,  # For code review template
@@ -264,12 +262,15 @@ class CouncilOrchestrator:
 
         # Choose appropriate prompt
         if use_code_synthesis:
-            prompt_template = CODE_STAGE3_SYNTHESIS_PROMPT
+            prompt_template = CODE_STAGE3_SYNTHESIS
         else:
-            prompt_template = STAGE3_SYNTHESIS_PROMPT
+            prompt_template = STAGE3_SYNTHESIS
 
-        chairman_prompt = prompt_template.format(
-            user_query=user_query, stage1_text=stage1_text, stage2_text=stage2_text
+        chairman_prompt = render_prompt(
+            prompt_template,
+            user_query=user_query,
+            stage1_text=stage1_text,
+            stage2_text=stage2_text,
         )
 
         messages = [{"role": "user", "content": chairman_prompt}]
@@ -602,7 +603,7 @@ class CouncilOrchestrator:
                 logger.info(
                     f"\n--- {r['model']} (member_index: {r['member_index']}) ---"
                 )
-                logger.info(r["diff"][:2000] if len(r["diff"]) > 2000 else r["diff"])
+                logger.info(r["diff"][:2000])
 
             return {"status": "dry_run", "members_with_diffs": len(members_with_diffs)}
 
@@ -615,16 +616,14 @@ class CouncilOrchestrator:
                 }
 
             target_idx = merge_member - 1  # Convert to 0-based
-            matching = [
-                r for r in members_with_diffs if r.get("member_index") == target_idx
-            ]
+            members_by_index = {r.get("member_index"): r for r in members_with_diffs}
+            target_member = members_by_index.get(target_idx)
 
-            if not matching:
+            if target_member is None:
                 return {
                     "status": "error",
                     "message": f"Member {merge_member} not found or has no changes",
                 }
-            target_member = matching[0]
 
         elif merge_mode == "auto":
             # Find top-ranked member with a diff
@@ -646,20 +645,25 @@ class CouncilOrchestrator:
                     "message": f"Could not find model for {top_label}",
                 }
 
+            # First member with each model that has a diff
+            members_by_model = {}
+            for r in members_with_diffs:
+                members_by_model.setdefault(r["model"], r)
+
             # Find the member with this model that has a diff
-            matching = [r for r in members_with_diffs if r["model"] == top_model]
+            target_member = members_by_model.get(top_model)
 
-            if not matching:
+            if target_member is None:
                 # Top-ranked member has no changes, try next ranked members
                 logger.warning(f"Top-ranked {top_model} has no code changes")
                 for label, score in aggregate_rankings[1:]:
                     model = label_to_model.get(label)
-                    matching = [r for r in members_with_diffs if r["model"] == model]
-                    if matching:
+                    target_member = members_by_model.get(model)
+                    if target_member is not None:
                         logger.info(f"Using next ranked member with changes: {model}")
                         break
 
-            if not matching:
+            if target_member is None:
                 # No ranked member has changes - this is an error
                 logger.error("No ranked member has code changes")
                 return {
@@ -667,8 +671,6 @@ class CouncilOrchestrator:
                     "message": "None of the ranked members produced code changes",
                 }
 
-            target_member = matching[0]
-
         if target_member is None:
             return {"status": "error", "message": "No target member found for merge"}
 
@@ -678,8 +680,8 @@ class CouncilOrchestrator:
         if no_commit:
             logger.info("(--no-commit: changes will be applied as unstaged)")
         logger.info("=" * 80)
-        diff = target_member["diff"]
-        logger.info(diff[:3000] if len(diff) > 3000 else diff)
+        # Slicing a shorter string returns it as is, without a copy
+        logger.info(target_member["diff"][:3000])
         logger.info("=" * 80)
 
         if confirm_merge:
@@ -754,13 +756,7 @@ class CouncilOrchestrator:
         Returns:
             A short title (3-5 words)
         """
-        title_prompt = """Generate a very short title (3-5 words maximum) that summarizes the following question.
-The title should be concise and descriptive. Do not use quotes or punctuation in the title.
-Respond with ONLY the title, nothing else.
-
-Question: {query}
-
-Title:""".format(query=user_query)
+        title_prompt = render_prompt(TITLE, query=user_query)
 
         messages = [{"role": "user", "content": title_prompt}]
 
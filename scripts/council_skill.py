@@ -19,10 +19,12 @@ import sys
 from pathlib import Path
 
 # Add scripts directory to path
-SCRIPTS_DIR = Path(__file__).parent
-sys.path.insert(0, str(SCRIPTS_DIR))
+_scripts_path = str(Path(__file__).parent.resolve())
+if _scripts_path not in sys.path:
+    sys.path.insert(0, _scripts_path)
 
 # Re-export main components for backward compatibility
+from config import SCRIPTS_DIR
 from api import CouncilAPI, MergeOptions, SessionProgress, SessionStatus, get_api
 from cli import format_results, main
 
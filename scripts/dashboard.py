@@ -5,13 +5,17 @@ A real-time terminal dashboard to monitor council sessions.
 Shows member status, current stage, logs, and statistics.
 """
 
+import math
 import time
+import queue
+import shutil
+import signal
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Union
 from collections import deque
 
 from rich.console import Console, Group
@@ -22,6 +26,14 @@ from rich.layout import Layout
 from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.style import Style
+from loguru import logger
+
+
+def _truncate(text: str, max_len: int, ellipsis: str = "...") -> str:
+    """Truncate text to max_len characters, marking the cut with an ellipsis."""
+    if len(text) <= max_len:
+        return text
+    return text[:max_len - len(ellipsis)] + ellipsis
 
 
 class MemberStatus(Enum):
@@ -40,7 +52,8 @@ class MemberState:
     provider: str
     status: MemberStatus = MemberStatus.IDLE
     last_activity: str = ""
-    activity_time: Optional[datetime] = None
+    activity_display: str = "-"  # last_activity truncated for the table
+    activity_time: Optional[float] = None  # time.monotonic() of last activity
     api_calls: int = 0
     tokens_used: int = 0
     error_message: Optional[str] = None
@@ -62,18 +75,30 @@ class DashboardState:
     # Members
     members: Dict[str, MemberState] = field(default_factory=dict)
     
-    # Logs (circular buffer - increased to show more context)
+    # Logs as (time_str, level, message) tuples
+    # (circular buffer - increased to show more context)
     log_messages: deque = field(default_factory=lambda: deque(maxlen=50))
+    # Tail window actually shown in the logs panel
+    display_logs: deque = field(default_factory=lambda: deque(maxlen=15))
     
-    # Statistics
-    total_api_calls: int = 0
-    total_tokens: int = 0
+    # Statistics (API call and token totals are summed from members)
     errors: int = 0
+    total_logs: int = 0
     
     # Countdown
     countdown_seconds: Optional[int] = None
     is_completed: bool = False
     
+    @property
+    def total_api_calls(self) -> int:
+        """Total API calls across all members."""
+        return sum(m.api_calls for m in self.members.values())
+    
+    @property
+    def total_tokens(self) -> int:
+        """Total tokens used across all members."""
+        return sum(m.tokens_used for m in self.members.values())
+    
     def elapsed_time(self) -> str:
         """Get elapsed time as string."""
         if self.started_at is None:
@@ -102,80 +127,222 @@ class CouncilDashboard:
         dashboard.stop()
     """
     
+    _STATUS_ICONS: Dict[MemberStatus, str] = {
+        MemberStatus.IDLE: "⚪",
+        MemberStatus.WAITING: "⏳",
+        MemberStatus.ACTIVE: "🟢",
+        MemberStatus.COMPLETED: "✅",
+        MemberStatus.ERROR: "❌",
+    }
+    _DEFAULT_ICON = "⚪"
+    
+    _STATUS_STYLES: Dict[MemberStatus, Style] = {
+        MemberStatus.IDLE: Style(dim=True),
+        MemberStatus.WAITING: Style(color="yellow"),
+        MemberStatus.ACTIVE: Style(color="green", bold=True),
+        MemberStatus.COMPLETED: Style(color="cyan"),
+        MemberStatus.ERROR: Style(color="red", bold=True),
+    }
+    _DEFAULT_STYLE = Style()
+    
+    _LEVEL_STYLES: Dict[str, str] = {
+        "INFO": "cyan",
+        "SUCCESS": "green",
+        "WARNING": "yellow",
+        "ERROR": "red bold",
+        "DEBUG": "dim",
+    }
+    
+    _STAGES = (
+        (1, "Responses"),
+        (2, "Rankings"),
+        (3, "Synthesis"),
+    )
+    
     def __init__(self):
         """Initialize the dashboard."""
-        self.console = Console()
+        # Pin the terminal size so renders don't query it every refresh;
+        # it is re-read on SIGWINCH, or polled once a second where there is
+        # no SIGWINCH handler (Windows, or start() off the main thread)
+        width, height = shutil.get_terminal_size((120, 40))
+        self.console = Console(width=width, height=height)
+        self._prev_sigwinch = None
+        self._poll_size = False
+        self._last_size_check = 0.0
         self.state = DashboardState()
         self._live: Optional[Live] = None
         self._running = False
         self._lock = threading.Lock()
+        
+        # Dirty tracking: setters bump _state_version under _lock; logs
+        # bump _log_version when they are drained from the inbox
+        self._state_version = 0
+        self._log_version = 0
+        self._last_rendered_version = None
+        self._last_render_time = 0.0
+        self._last_render_error = 0.0
+        self._layout: Optional[Layout] = None
+        
+        # Scheduled close (see countdown_and_close)
+        self._close_at: Optional[float] = None
+        self._closed = threading.Event()
+        self._layout_skeleton: Optional[Layout] = None
+        self._skeleton_member_count = -1
+        self._regions: Dict[str, Layout] = {}
+        
+        # Member updates are coalesced here until the next render
+        self._pending_member_updates: Dict[str, dict] = {}
+        self._pending_lock = threading.Lock()
+        
+        # Log producers only push here; the render side drains in batches
+        self._log_inbox: queue.SimpleQueue = queue.SimpleQueue()
+        
+        # Rendered panels keyed by the state they were built from
+        self._panel_cache: Dict[str, tuple] = {}
+        self._member_row_cache: Dict[str, tuple] = {}
+        self._build_stage_cells()
+        self._build_panels()
+    
+    def _current_version(self) -> tuple:
+        """Get a snapshot of the state version for dirty checking."""
+        return (self._state_version, self._log_version)
+    
+    def _cache_lookup(self, name: str, key: Any) -> Optional[Panel]:
+        """Return the cached panel for name if it was built from key."""
+        cached = self._panel_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        return None
+    
+    def _cache_store(self, name: str, key: Any, panel: Panel) -> Panel:
+        """Cache a freshly built panel and return it."""
+        self._panel_cache[name] = (key, panel)
+        return panel
     
     def _get_status_icon(self, status: MemberStatus) -> str:
         """Get icon for member status."""
-        icons = {
-            MemberStatus.IDLE: "⚪",
-            MemberStatus.WAITING: "⏳",
-            MemberStatus.ACTIVE: "🟢",
-            MemberStatus.COMPLETED: "✅",
-            MemberStatus.ERROR: "❌",
-        }
-        return icons.get(status, "⚪")
+        return self._STATUS_ICONS.get(status, self._DEFAULT_ICON)
     
     def _get_status_style(self, status: MemberStatus) -> Style:
         """Get style for member status."""
-        styles = {
-            MemberStatus.IDLE: Style(dim=True),
-            MemberStatus.WAITING: Style(color="yellow"),
-            MemberStatus.ACTIVE: Style(color="green", bold=True),
-            MemberStatus.COMPLETED: Style(color="cyan"),
-            MemberStatus.ERROR: Style(color="red", bold=True),
+        return self._STATUS_STYLES.get(status, self._DEFAULT_STYLE)
+    
+    def _build_stage_cells(self) -> None:
+        """Prebuild the stage-flow cells for every (stage, state) combination."""
+        cell_styles = {
+            "allcompleted": ("green bold", " ✓", "green"),
+            "active": ("yellow bold on blue", " ●", "yellow bold"),
+            "past": ("green", " ✓", "green"),
+            "future": ("dim", None, None),
+        }
+        
+        self._stage_cells: Dict[tuple, Text] = {}
+        for stage_num, stage_name in self._STAGES:
+            for state, (label_style, marker, marker_style) in cell_styles.items():
+                cell = Text()
+                cell.append(f"[{stage_num}] {stage_name}", style=label_style)
+                if marker:
+                    cell.append(marker, style=marker_style)
+                self._stage_cells[(stage_num, state)] = cell
+        
+        self._arrow_active = Text(" ━━▶ ", style="green")
+        self._arrow_dim = Text(" ───▶ ", style="dim")
+    
+    def _build_panels(self) -> None:
+        """Create the panels and text buffers that are refilled on each rebuild."""
+        self._header_title = Text("🏛️  LLM Council Dashboard", style="bold white on blue")
+        self._header_status = Text()
+        self._stage_flow = Text()
+        self._header_session = Group(self._header_title, self._header_status, self._stage_flow)
+        self._header_waiting = Group(
+            self._header_title,
+            Text(""),
+            Text("Waiting for session...", style="dim italic"),
+        )
+        self._log_text = Text()
+        self._no_logs_text = Text("No logs yet...", style="dim italic")
+        self._query_text = Text(style="italic")
+        
+        self._panels: Dict[str, Panel] = {
+            "header": Panel(self._header_waiting, border_style="blue", padding=(0, 1)),
+            "members": Panel(
+                "",
+                title="[bold]Council Members[/bold]",
+                border_style="green",
+                padding=(0, 1),
+            ),
+            "logs": Panel(
+                self._no_logs_text,
+                title="[bold]Recent Logs (0 total)[/bold]",
+                border_style="yellow",
+                padding=(0, 1),
+            ),
+            "stats": Panel(
+                "",
+                title="[bold]Statistics[/bold]",
+                border_style="cyan",
+                padding=(0, 1),
+            ),
+            "query": Panel(
+                self._query_text,
+                title="[bold]Current Query[/bold]",
+                border_style="magenta",
+                padding=(0, 1),
+            ),
         }
-        return styles.get(status, Style())
+    
+    @staticmethod
+    def _clear_text(text: Text) -> Text:
+        """Empty a reusable Text buffer (spans included) and return it."""
+        text.plain = ""
+        return text
     
     def _create_stage_flow(self) -> Text:
         """Create a horizontal stage flow indicator."""
-        stages = [
-            (1, "Responses"),
-            (2, "Rankings"),
-            (3, "Synthesis"),
-        ]
+        current_stage = self.state.current_stage
         
-        flow = Text()
+        flow = self._clear_text(self._stage_flow)
         
-        for i, (stage_num, stage_name) in enumerate(stages):
+        for i, (stage_num, _) in enumerate(self._STAGES):
             if i > 0:
                 # Arrow connector
-                if self.state.current_stage > stages[i-1][0]:
-                    flow.append(" ━━▶ ", style="green")
+                if current_stage > self._STAGES[i-1][0]:
+                    flow.append_text(self._arrow_active)
                 else:
-                    flow.append(" ───▶ ", style="dim")
+                    flow.append_text(self._arrow_dim)
             
             # Stage box
-            if self.state.is_completed and stage_num <= 3:
-                # All completed
-                flow.append(f"[{stage_num}] {stage_name}", style="green bold")
-                flow.append(" ✓", style="green")
-            elif stage_num == self.state.current_stage:
-                # Active stage
-                flow.append(f"[{stage_num}] {stage_name}", style="yellow bold on blue")
-                flow.append(" ●", style="yellow bold")
-            elif stage_num < self.state.current_stage:
-                # Completed stage
-                flow.append(f"[{stage_num}] {stage_name}", style="green")
-                flow.append(" ✓", style="green")
+            if self.state.is_completed:
+                state = "allcompleted"
+            elif stage_num == current_stage:
+                state = "active"
+            elif stage_num < current_stage:
+                state = "past"
             else:
-                # Future stage
-                flow.append(f"[{stage_num}] {stage_name}", style="dim")
+                state = "future"
+            flow.append_text(self._stage_cells[(stage_num, state)])
         
         return flow
     
     def _create_header(self) -> Panel:
         """Create the header panel."""
-        title = Text("🏛️  LLM Council Dashboard", style="bold white on blue")
+        key = (
+            self.state.session_id,
+            self.state.started_at is not None,
+            self.state.current_stage,
+            self.state.is_completed,
+            self.state.countdown_seconds,
+            self.state.elapsed_time(),
+        )
+        cached = self._cache_lookup("header", key)
+        if cached is not None:
+            return cached
+        
+        panel = self._panels["header"]
         
         # Status line
         if self.state.started_at:
-            status_text = Text()
+            status_text = self._clear_text(self._header_status)
             status_text.append(f"Session: ", style="dim")
             status_text.append(self.state.session_id or "N/A", style="cyan")
             status_text.append(" │ ", style="dim")
@@ -189,16 +356,30 @@ class CouncilDashboard:
                 status_text.append(f"{self.state.countdown_seconds}s", style="yellow bold")
             
             # Stage flow on separate line
-            stage_flow = self._create_stage_flow()
-            content = Group(title, status_text, stage_flow)
+            self._create_stage_flow()
+            panel.renderable = self._header_session
         else:
-            status_text = Text("Waiting for session...", style="dim italic")
-            content = Group(title, Text(""), status_text)
+            panel.renderable = self._header_waiting
         
-        return Panel(content, border_style="blue", padding=(0, 1))
+        return self._cache_store("header", key, panel)
     
     def _create_members_table(self) -> Panel:
         """Create the members status table."""
+        now = time.monotonic()
+        key = tuple(
+            (
+                member_id,
+                member.status,
+                member.activity_display,
+                member.api_calls,
+                int(now - member.activity_time) if member.activity_time else None,
+            )
+            for member_id, member in self.state.members.items()
+        )
+        cached = self._cache_lookup("members", key)
+        if cached is not None:
+            return cached
+        
         table = Table(
             show_header=True,
             header_style="bold magenta",
@@ -213,130 +394,132 @@ class CouncilDashboard:
         table.add_column("Time", width=8, justify="right")
         table.add_column("API", width=5, justify="right")
         
-        for member in self.state.members.values():
-            icon = self._get_status_icon(member.status)
-            style = self._get_status_style(member.status)
+        # Styled cells are reused per member until its status or activity
+        # changes; typically only one row differs between two builds
+        row_cache = {}
+        for member_id, member in self.state.members.items():
+            cell_key = (member.status, member.name, member.activity_display)
+            cached_cells = self._member_row_cache.get(member_id)
+            if cached_cells is not None and cached_cells[0] == cell_key:
+                cells = cached_cells[1]
+            else:
+                style = self._get_status_style(member.status)
+                cells = (
+                    self._get_status_icon(member.status),
+                    Text(member.name, style=style),
+                    Text(member.activity_display, style=style),
+                )
+            row_cache[member_id] = (cell_key, cells)
+            icon, name_text, activity_text = cells
             
             # Calculate time since last activity
             if member.activity_time:
-                delta = datetime.now() - member.activity_time
-                time_str = f"{int(delta.total_seconds())}s"
+                time_str = f"{int(now - member.activity_time)}s"
             else:
                 time_str = "-"
             
-            activity = member.last_activity or "-"
-            if len(activity) > 25:
-                activity = activity[:22] + "..."
-            
             table.add_row(
                 icon,
-                Text(member.name, style=style),
+                name_text,
                 member.provider,
-                Text(activity, style=style),
+                activity_text,
                 time_str,
                 str(member.api_calls),
             )
+        self._member_row_cache = row_cache
         
         if not self.state.members:
             table.add_row("", Text("No members registered", style="dim italic"), "", "", "", "")
         
-        return Panel(
-            table,
-            title="[bold]Council Members[/bold]",
-            border_style="green",
-            padding=(0, 1),
-        )
+        # Rich tables can't drop rows, so only the table itself is rebuilt
+        panel = self._panels["members"]
+        panel.renderable = table
+        return self._cache_store("members", key, panel)
     
     def _create_logs_panel(self) -> Panel:
         """Create the logs panel."""
-        # Take a snapshot of logs - deque iteration is safe in CPython
-        # Using list() creates an atomic copy
-        log_snapshot = list(self.state.log_messages)
-        
-        # Show only the most recent logs that fit in the panel
-        # Keep chronological order (oldest first, newest at bottom - like a terminal)
-        recent_logs = log_snapshot[-15:]  # Last 15 entries
-        
-        log_text = Text()
+        key = (self._log_version, self.state.total_logs)
+        cached = self._cache_lookup("logs", key)
+        if cached is not None:
+            return cached
+        
+        # Snapshot only the display tail (15 entries) - tuple() of a deque
+        # is atomic in CPython. Chronological order, newest at the bottom.
+        recent_logs = tuple(self.state.display_logs)
+        total_logs = self.state.total_logs
+        
+        panel = self._panels["logs"]
+        if recent_logs:
+            # Refill the shared buffer with one assembled Text per line:
+            # dim "time │ ", level, " │ ", message
+            log_text = self._clear_text(self._log_text)
+            append_text = log_text.append_text
+            for i, (time_str, level, message) in enumerate(recent_logs):
+                if i:
+                    log_text.append("\n")
+                append_text(Text.assemble(
+                    (time_str + " │ ", "dim"),
+                    (f"{level:7}", self._LEVEL_STYLES.get(level, "white")),
+                    (" │ ", "dim"),
+                    (message, "red" if level == "ERROR" else ""),
+                ))
+            panel.renderable = log_text
+        else:
+            panel.renderable = self._no_logs_text
+        panel.title = f"[bold]Recent Logs ({total_logs} total)[/bold]"
         
-        for i, (timestamp, level, message) in enumerate(recent_logs):
-            if i > 0:
-                log_text.append("\n")
-            
-            # Time
-            log_text.append(timestamp.strftime("%H:%M:%S"), style="dim")
-            log_text.append(" │ ", style="dim")
-            
-            # Level with color
-            level_styles = {
-                "INFO": "cyan",
-                "SUCCESS": "green",
-                "WARNING": "yellow", 
-                "ERROR": "red bold",
-                "DEBUG": "dim",
-            }
-            log_text.append(f"{level:7}", style=level_styles.get(level, "white"))
-            log_text.append(" │ ", style="dim")
-            
-            # Message
-            msg_style = "red" if level == "ERROR" else ""
-            log_text.append(message[:80], style=msg_style)
-        
-        if not log_snapshot:
-            log_text = Text("No logs yet...", style="dim italic")
-        
-        return Panel(
-            log_text,
-            title=f"[bold]Recent Logs ({len(log_snapshot)} total)[/bold]",
-            border_style="yellow",
-            padding=(0, 1),
-        )
+        return self._cache_store("logs", key, panel)
     
     def _create_stats_panel(self) -> Panel:
         """Create the statistics panel."""
+        total_api_calls = self.state.total_api_calls
+        total_tokens = self.state.total_tokens
+        key = (
+            total_api_calls,
+            total_tokens,
+            self.state.errors,
+            len(self.state.members),
+            # Log count only needs to refresh every few messages
+            self.state.total_logs // 10,
+        )
+        cached = self._cache_lookup("stats", key)
+        if cached is not None:
+            return cached
+        
         stats = Table.grid(padding=(0, 2))
         stats.add_column(justify="right", style="dim")
         stats.add_column(justify="left", style="bold")
         
-        stats.add_row("API Calls:", str(self.state.total_api_calls))
-        stats.add_row("Tokens:", f"{self.state.total_tokens:,}" if self.state.total_tokens else "-")
+        stats.add_row("API Calls:", str(total_api_calls))
+        stats.add_row("Tokens:", f"{total_tokens:,}" if total_tokens else "-")
         stats.add_row("Errors:", Text(str(self.state.errors), style="red" if self.state.errors else "green"))
         stats.add_row("Members:", str(len(self.state.members)))
-        stats.add_row("Log Count:", str(len(self.state.log_messages)))
+        stats.add_row("Log Count:", str(self.state.total_logs))
         
-        return Panel(
-            stats,
-            title="[bold]Statistics[/bold]",
-            border_style="cyan",
-            padding=(0, 1),
-        )
+        panel = self._panels["stats"]
+        panel.renderable = stats
+        return self._cache_store("stats", key, panel)
     
     def _create_query_panel(self) -> Panel:
         """Create the query display panel."""
-        query = self.state.query or "No query set"
-        if len(query) > 100:
-            query = query[:97] + "..."
-        
-        return Panel(
-            Text(query, style="italic"),
-            title="[bold]Current Query[/bold]",
-            border_style="magenta",
-            padding=(0, 1),
-        )
+        key = self.state.query
+        cached = self._cache_lookup("query", key)
+        if cached is not None:
+            return cached
+        
+        query = _truncate(self.state.query or "No query set", 100)
+        self._clear_text(self._query_text).append(query)
+        
+        return self._cache_store("query", key, self._panels["query"])
     
-    def _create_layout(self) -> Layout:
-        """Create the dashboard layout."""
+    def _build_layout_skeleton(self, member_count: int) -> Layout:
+        """Build the fixed layout tree for the given member count."""
         layout = Layout()
         
-        # Calculate dynamic sizes based on member count
-        member_count = len(self.state.members)
         # Header row (1) + each member row (1) + padding (2 for borders)
         members_height = max(4, member_count + 3)
         # Stats panel: 6 rows + borders
         stats_height = 8
-        # Query panel: 3 rows + borders  
-        query_height = 5
-        sidebar_height = stats_height + query_height
         
         # Main structure (header size increased for stage flow)
         layout.split_column(
@@ -363,12 +546,7 @@ class CouncilDashboard:
             Layout(name="query"),  # Query takes remaining space
         )
         
-        # Populate
-        layout["header"].update(self._create_header())
-        layout["members"].update(self._create_members_table())
-        layout["logs"].update(self._create_logs_panel())
-        layout["stats"].update(self._create_stats_panel())
-        layout["query"].update(self._create_query_panel())
+        # The footer never changes
         layout["footer"].update(
             Panel(
                 Text("Press Ctrl+C to exit", justify="center", style="dim"),
@@ -376,14 +554,41 @@ class CouncilDashboard:
             )
         )
         
+        # Keep direct references so per-tick updates skip the name lookup
+        self._regions = {
+            name: layout[name]
+            for name in ("header", "members", "logs", "stats", "query")
+        }
         return layout
     
+    def _update_layout_panels(self) -> None:
+        """Refresh the content of each layout region."""
+        self._regions["header"].update(self._create_header())
+        self._regions["members"].update(self._create_members_table())
+        self._regions["logs"].update(self._create_logs_panel())
+        self._regions["stats"].update(self._create_stats_panel())
+        self._regions["query"].update(self._create_query_panel())
+    
+    def _create_layout(self) -> Layout:
+        """Create the dashboard layout."""
+        self._flush_pending()
+        
+        # The skeleton only depends on the member count (members table height)
+        member_count = len(self.state.members)
+        if self._layout_skeleton is None or member_count != self._skeleton_member_count:
+            self._layout_skeleton = self._build_layout_skeleton(member_count)
+            self._skeleton_member_count = member_count
+        
+        self._update_layout_panels()
+        return self._layout_skeleton
+    
     # =========================================================================
     # Public API for updating dashboard state
     # =========================================================================
     
     def start_session(self, session_id: str, query: str) -> None:
         """Start a new session."""
+        self._flush_pending()
         with self._lock:
             self.state.session_id = session_id
             self.state.query = query
@@ -391,15 +596,18 @@ class CouncilDashboard:
             self.state.current_stage = 0
             self.state.stage_name = "Starting"
             self.state.log_messages.clear()
-            self.state.total_api_calls = 0
-            self.state.total_tokens = 0
+            self.state.display_logs.clear()
             self.state.errors = 0
+            self.state.total_logs = 0
             # Reset member statuses
             for member in self.state.members.values():
                 member.status = MemberStatus.WAITING
                 member.api_calls = 0
+                member.tokens_used = 0
                 member.last_activity = "Waiting..."
-                member.activity_time = datetime.now()
+                member.activity_display = "Waiting..."
+                member.activity_time = time.monotonic()
+            self._state_version += 1
     
     def set_stage(self, stage: int, name: str, progress: float = 0.0) -> None:
         """Set current stage."""
@@ -407,6 +615,7 @@ class CouncilDashboard:
             self.state.current_stage = stage
             self.state.stage_name = name
             self.state.stage_progress = progress
+            self._state_version += 1
     
     def register_member(self, member_id: str, name: str, provider: str) -> None:
         """Register a council member."""
@@ -416,6 +625,7 @@ class CouncilDashboard:
                 provider=provider,
                 status=MemberStatus.IDLE,
             )
+            self._state_version += 1
     
     def update_member(
         self,
@@ -426,36 +636,88 @@ class CouncilDashboard:
         tokens_delta: int = 0,
         error: Optional[str] = None,
     ) -> None:
-        """Update a member's state."""
-        with self._lock:
-            if member_id not in self.state.members:
-                return
-            
-            member = self.state.members[member_id]
+        """
+        Queue an update to a member's state.
+        
+        Updates are merged per member and applied in one batch by
+        _flush_pending() on the next render, so bursts of updates cost a
+        single state change per refresh.
+        """
+        with self._pending_lock:
+            pending = self._pending_member_updates.setdefault(member_id, {})
             
             if status is not None:
-                member.status = status
+                pending["status"] = status
             if activity is not None:
-                member.last_activity = activity
-                member.activity_time = datetime.now()
+                pending["activity"] = activity
+                pending["activity_time"] = time.monotonic()
             if api_calls_delta:
-                member.api_calls += api_calls_delta
-                self.state.total_api_calls += api_calls_delta
+                pending["api_calls"] = pending.get("api_calls", 0) + api_calls_delta
             if tokens_delta:
-                member.tokens_used += tokens_delta
-                self.state.total_tokens += tokens_delta
+                pending["tokens"] = pending.get("tokens", 0) + tokens_delta
             if error is not None:
-                member.error_message = error
-                member.status = MemberStatus.ERROR
-                self.state.errors += 1
+                pending["error"] = error
+                pending["status"] = MemberStatus.ERROR
+                pending["errors"] = pending.get("errors", 0) + 1
+    
+    def _flush_pending(self) -> None:
+        """Apply queued member updates and log messages to the dashboard state."""
+        self._drain_logs()
+        
+        with self._pending_lock:
+            if not self._pending_member_updates:
+                return
+            updates = self._pending_member_updates
+            self._pending_member_updates = {}
+        
+        with self._lock:
+            for member_id, pending in updates.items():
+                member = self.state.members.get(member_id)
+                if member is None:
+                    continue
+                
+                if "status" in pending:
+                    member.status = pending["status"]
+                if "activity" in pending:
+                    member.last_activity = pending["activity"]
+                    member.activity_display = _truncate(pending["activity"] or "-", 25)
+                    member.activity_time = pending["activity_time"]
+                if "api_calls" in pending:
+                    member.api_calls += pending["api_calls"]
+                if "tokens" in pending:
+                    member.tokens_used += pending["tokens"]
+                if "error" in pending:
+                    member.error_message = pending["error"]
+                    self.state.errors += pending["errors"]
+            self._state_version += 1
     
     def add_log(self, message: str, level: str = "INFO") -> None:
-        """Add a log message. Thread-safe via atomic deque.append()."""
-        # deque.append() is thread-safe in CPython, no lock needed
-        self.state.log_messages.append((datetime.now(), level, message))
+        """Add a log message. Thread-safe and lock-free via SimpleQueue."""
+        # Messages are cut to the panel width here, once, rather than on
+        # every render
+        self._log_inbox.put_nowait((datetime.now(), level, message[:80]))
+    
+    def _drain_logs(self) -> None:
+        """Move queued log messages from the inbox into the state buffers."""
+        drained = False
+        with self._lock:
+            while True:
+                try:
+                    timestamp, level, message = self._log_inbox.get_nowait()
+                except queue.Empty:
+                    break
+                # Format the timestamp once here instead of on every render
+                entry = (timestamp.strftime("%H:%M:%S"), level, message)
+                self.state.log_messages.append(entry)
+                self.state.display_logs.append(entry)
+                self.state.total_logs += 1
+                drained = True
+            if drained:
+                self._log_version += 1
     
     def complete_session(self, success: bool = True) -> None:
         """Mark session as completed."""
+        self._flush_pending()
         with self._lock:
             self.state.is_completed = True
             if success:
@@ -465,25 +727,49 @@ class CouncilDashboard:
                         member.status = MemberStatus.COMPLETED
             else:
                 self.state.stage_name = "❌ Failed"
+            self._state_version += 1
     
     def set_countdown(self, seconds: int) -> None:
         """Set countdown seconds for display."""
         with self._lock:
             self.state.countdown_seconds = seconds
+            self._state_version += 1
     
     def countdown_and_close(self, timeout_seconds: int) -> None:
         """
-        Run countdown and close dashboard after timeout.
+        Schedule the dashboard to close after a countdown.
+        
+        Returns immediately; the render loop updates the countdown display
+        and signals closing once the deadline passes. Use
+        wait_until_closed() to block until then.
         
         Args:
             timeout_seconds: Number of seconds to countdown before closing
         """
-        import time
         self.add_log(f"Closing in {timeout_seconds} seconds...", "INFO")
-        for remaining in range(timeout_seconds, 0, -1):
-            self.set_countdown(remaining)
-            time.sleep(1)
-        self.set_countdown(0)
+        self._closed.clear()
+        self.set_countdown(timeout_seconds)
+        self._close_at = time.monotonic() + timeout_seconds
+    
+    def wait_until_closed(self) -> None:
+        """Block until a scheduled countdown_and_close() has elapsed."""
+        if self._close_at is None or not self._running:
+            return
+        remaining = self._close_at - time.monotonic()
+        # The render loop normally signals first; the margin covers a stalled refresh
+        self._closed.wait(max(0.0, remaining) + 1.0)
+    
+    def _update_countdown(self) -> None:
+        """Advance a scheduled countdown from the render loop."""
+        if self._close_at is None:
+            return
+        remaining = self._close_at - time.monotonic()
+        seconds = max(0, math.ceil(remaining))
+        if seconds != self.state.countdown_seconds:
+            self.set_countdown(seconds)
+        if remaining <= 0:
+            self._close_at = None
+            self._closed.set()
     
     # =========================================================================
     # Display control
@@ -499,44 +785,101 @@ class CouncilDashboard:
         self._running = True
         self._refresh_rate = refresh_rate
         
-        # Create Live with auto_refresh=True so it updates automatically
+        # Live drives the refresh schedule itself and pulls the current
+        # layout through get_renderable on every tick
         self._live = Live(
-            self._create_layout(),
             console=self.console,
             refresh_per_second=refresh_rate,
             screen=True,
-            auto_refresh=True,  # Enable automatic refresh
+            auto_refresh=True,
+            get_renderable=self._render,
         )
+        self._poll_size = not self._install_resize_handler()
         self._live.start()
+    
+    def _install_resize_handler(self) -> bool:
+        """
+        Track terminal resizes where SIGWINCH is available (not on Windows).
         
-        # Start background thread to update layout periodically
-        import threading
-        def _auto_update():
-            while self._running and self._live:
-                try:
-                    self._live.update(self._create_layout())
-                except Exception:
-                    pass
-                import time
-                time.sleep(1.0 / refresh_rate)
+        Returns:
+            True if the handler was installed
+        """
+        if not hasattr(signal, "SIGWINCH"):
+            return False
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        self._prev_sigwinch = signal.signal(signal.SIGWINCH, self._on_resize)
+        return True
+    
+    def _on_resize(self, signum, frame) -> None:
+        """SIGWINCH handler: pick up the new terminal size."""
+        self._sync_size()
+    
+    def _sync_size(self) -> None:
+        """Re-read the terminal size and force a rebuild if it changed."""
+        size = shutil.get_terminal_size((120, 40))
+        if (size.columns, size.lines) != tuple(self.console.size):
+            self.console.size = (size.columns, size.lines)
+            self._state_version += 1
+    
+    def _render(self) -> Union[Layout, Panel]:
+        """
+        Return the layout for the current state.
         
-        self._update_thread = threading.Thread(target=_auto_update, daemon=True)
-        self._update_thread.start()
+        The previous layout is reused while the state is unchanged, except
+        for a once-per-second rebuild that keeps the elapsed clock ticking.
+        """
+        self._flush_pending()
+        self._update_countdown()
+        now = time.monotonic()
+        if self._poll_size and now - self._last_size_check >= 1.0:
+            self._last_size_check = now
+            self._sync_size()
+        version = self._current_version()
+        if (
+            self._layout is None
+            or version != self._last_rendered_version
+            or now - self._last_render_time >= 1.0
+        ):
+            try:
+                self._layout = self._create_layout()
+                self._last_rendered_version = version
+                self._last_render_time = now
+            except Exception:
+                # Raising here would kill Live's refresh thread, so keep
+                # showing the previous layout (or an error panel before the
+                # first one) and log the failure at most every few seconds,
+                # since it repeats on each refresh
+                if now - self._last_render_error >= 5.0:
+                    self._last_render_error = now
+                    logger.exception("Dashboard render failed")
+                if self._layout is None:
+                    return Panel(
+                        Text("Dashboard render failed; see the log file", style="bold red"),
+                        title="LLM Council",
+                        border_style="red",
+                    )
+        return self._layout
     
     def stop(self) -> None:
         """Stop the live dashboard."""
         self._running = False
-        # Wait for update thread to finish
-        if hasattr(self, '_update_thread') and self._update_thread.is_alive():
-            self._update_thread.join(timeout=0.5)
         if self._live:
             self._live.stop()
             self._live = None
+        if self._prev_sigwinch is not None:
+            signal.signal(signal.SIGWINCH, self._prev_sigwinch)
+            self._prev_sigwinch = None
     
     def refresh(self) -> None:
-        """Force refresh the display."""
-        if self._live:
-            self._live.update(self._create_layout())
+        """
+        Mark the display stale so the next refresh tick rebuilds it.
+        
+        Painting is left to Live's own refresh thread, so this never
+        renders on the caller's thread.
+        """
+        with self._lock:
+            self._state_version += 1
     
     def is_running(self) -> bool:
         """Check if dashboard is running."""
@@ -576,18 +919,21 @@ def create_dashboard_sink(dashboard: CouncilDashboard):
     """
     Create a loguru sink that forwards to the dashboard.
     
+    The sink only reads the raw record fields, so register it with
+    format="{message}" to keep loguru from building a full formatted line.
+    
     Usage:
         from loguru import logger
         dashboard = CouncilDashboard()
-        logger.add(create_dashboard_sink(dashboard))
+        logger.add(create_dashboard_sink(dashboard), format="{message}", level="INFO")
     """
+    inbox = dashboard._log_inbox
+    
     def sink(message):
         try:
             record = message.record
-            level = record["level"].name
-            text = record["message"]
-            # Add log immediately (thread-safe via _lock in add_log)
-            dashboard.add_log(text, level)
+            # Straight into the dashboard's lock-free inbox (see add_log)
+            inbox.put_nowait((record["time"], record["level"].name, record["message"][:80]))
         except Exception:
             # Silently ignore errors to prevent loguru from disabling this sink
             pass
@@ -657,6 +1003,7 @@ def demo():
         
         # Countdown before closing
         dashboard.countdown_and_close(5)
+        dashboard.wait_until_closed()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,11 @@
 """Logging configuration for LLM Council using loguru."""
 
+import os
 import sys
+import time
+import atexit
 from pathlib import Path
+from typing import Dict, TextIO
 from loguru import logger
 
 # Remove default handler
@@ -11,12 +15,101 @@ logger.remove()
 SCRIPTS_DIR = Path(__file__).parent
 DATA_DIR = SCRIPTS_DIR / "data"
 LOGS_DIR = DATA_DIR / "logs"
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
 MEMBER_LOGS_DIR = LOGS_DIR / "members"
-MEMBER_LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
-# Store member loggers
-_member_loggers = {}
+# Open member log files, keyed by sanitized member id
+_member_file_handles: Dict[str, TextIO] = {}
+
+# Characters written to each open member log, close enough to bytes for
+# rotation; tell() on a buffered text file would flush it on every record
+_member_log_sizes: Dict[str, int] = {}
+
+# Member log rotation/retention (mirrors the old per-member file handlers)
+MEMBER_LOG_MAX_BYTES = 1024 * 1024
+MEMBER_LOG_RETENTION_SECONDS = 3 * 24 * 60 * 60
+MEMBER_LOG_FORMAT = "{time:HH:mm:ss.SSS} | {level:<8} | {message}"
+MEMBER_LOG_BUFFER_SIZE = 8192
+
+
+def _rotate_member_log(safe_id: str) -> TextIO:
+    """
+    Rotate a member log that grew past MEMBER_LOG_MAX_BYTES.
+    
+    Args:
+        safe_id: Sanitized member id
+        
+    Returns:
+        Handle to the fresh log file
+    """
+    _member_file_handles[safe_id].close()
+    log_file = MEMBER_LOGS_DIR / f"{safe_id}.log"
+    
+    # A counter keeps two rotations within the same second apart
+    stamp = time.strftime('%Y-%m-%d_%H-%M-%S')
+    rotated = MEMBER_LOGS_DIR / f"{safe_id}.{stamp}.log"
+    count = 1
+    while rotated.exists():
+        rotated = MEMBER_LOGS_DIR / f"{safe_id}.{stamp}.{count}.log"
+        count += 1
+    try:
+        log_file.rename(rotated)
+    except OSError:
+        pass  # Keep appending to the current file; the handle is reopened below
+    
+    # Drop rotated files that are past retention
+    cutoff = time.time() - MEMBER_LOG_RETENTION_SECONDS
+    for old_file in MEMBER_LOGS_DIR.glob(f"{safe_id}.*.log"):
+        try:
+            if old_file.stat().st_mtime < cutoff:
+                old_file.unlink()
+        except OSError:
+            pass
+    
+    handle = open(log_file, "a", buffering=MEMBER_LOG_BUFFER_SIZE, encoding="utf-8")
+    _member_file_handles[safe_id] = handle
+    _member_log_sizes[safe_id] = 0
+    return handle
+
+
+def _member_dispatch_sink(message):
+    """Write a member log record to that member's file."""
+    safe_id = message.record["extra"].get("member_id")
+    handle = _member_file_handles.get(safe_id)
+    if handle is None:
+        return
+    if _member_log_sizes[safe_id] >= MEMBER_LOG_MAX_BYTES:
+        handle = _rotate_member_log(safe_id)
+    handle.write(message)
+    _member_log_sizes[safe_id] += len(message)
+    # Writes are buffered; errors go to disk right away
+    if message.record["level"].no >= 40:
+        handle.flush()
+
+
+@atexit.register
+def _close_member_logs():
+    """Flush and close member log files on exit."""
+    for handle in _member_file_handles.values():
+        try:
+            handle.close()
+        except OSError:
+            pass
+    _member_file_handles.clear()
+    _member_log_sizes.clear()
+
+
+def add_member_log_sink():
+    """
+    Register the single sink that routes member logs to per-member files.
+    
+    Call this again after logger.remove() to keep member logs.
+    """
+    logger.add(
+        _member_dispatch_sink,
+        level="DEBUG",
+        format=MEMBER_LOG_FORMAT,
+        filter=lambda record: "member_id" in record["extra"]
+    )
 
 
 def setup_logger(
@@ -26,6 +119,8 @@ def setup_logger(
     """
     Set up loguru logger with console and file outputs.
     
+    No files or directories are created until something is logged.
+    
     Args:
         console_level: Log level for console output
         file_level: Log level for file output
@@ -45,8 +140,12 @@ def setup_logger(
         format="{time:HH:mm:ss} | {level:<8} | {message}",
         rotation="1 day",
         retention="7 days",
+        delay=True,  # loguru creates the file (and LOGS_DIR) on first write
         filter=lambda record: "member_log" not in record["extra"]
     )
+    
+    # Member logs - one sink for all members, routed by member_id
+    add_member_log_sink()
 
 
 def get_member_logger(member_id: str, member_name: str):
@@ -63,20 +162,12 @@ def get_member_logger(member_id: str, member_name: str):
     # Sanitize member_id for filename
     safe_id = member_id.replace('/', '_').replace(':', '_')
     
-    # Create member-specific log file if not exists
-    if safe_id not in _member_loggers:
+    # Open the member's log file once; the dispatch sink writes to it
+    if safe_id not in _member_file_handles:
+        MEMBER_LOGS_DIR.mkdir(parents=True, exist_ok=True)
         log_file = MEMBER_LOGS_DIR / f"{safe_id}.log"
-        
-        # Add handler for this member
-        logger.add(
-            log_file,
-            level="DEBUG",
-            format="{time:HH:mm:ss.SSS} | {level:<8} | {message}",
-            filter=lambda record, sid=safe_id: record["extra"].get("member_id") == sid,
-            rotation="1 MB",
-            retention="3 days"
-        )
-        _member_loggers[safe_id] = True
+        _member_file_handles[safe_id] = open(log_file, "a", buffering=MEMBER_LOG_BUFFER_SIZE, encoding="utf-8")
+        _member_log_sizes[safe_id] = os.path.getsize(log_file)
     
     return logger.bind(member_id=safe_id, member_name=member_name, member_log=True)
 
@@ -98,4 +189,4 @@ def get_stage_logger(stage: str):
 setup_logger()
 
 # Export logger
-__all__ = ["logger", "setup_logger", "get_member_logger", "get_stage_logger", "LOGS_DIR"]
+__all__ = ["logger", "setup_logger", "add_member_log_sink", "get_member_logger", "get_stage_logger", "LOGS_DIR"]
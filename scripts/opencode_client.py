@@ -4,13 +4,81 @@ import subprocess
 import asyncio
 import shutil
 import os
-from typing import Optional, Dict, Any
+import re
+import functools
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 from logger import logger
 
-# Maximum command line length on Windows (conservative estimate)
-MAX_CMD_LENGTH = 6000
+# Read size when draining subprocess output
+READ_CHUNK_SIZE = 65536
+
+# Script invoked by an npm .cmd shim, e.g. "%dp0%\node_modules\opencode-ai\bin\opencode" %*
+_NPM_SHIM_SCRIPT = re.compile(r'"%dp0%\\([^"]+)"\s+%\*')
+
+
+def _find_opencode() -> str:
+    """Find the opencode executable path."""
+    # Try to find in PATH
+    opencode_path = shutil.which("opencode")
+    if opencode_path:
+        return opencode_path
+    
+    # Common installation paths on Windows
+    if os.name == 'nt':
+        npm_path = Path(os.environ.get('APPDATA', '')) / 'npm' / 'opencode.cmd'
+        if npm_path.exists():
+            return str(npm_path)
+    
+    # Default to hoping it's in PATH
+    return "opencode"
+
+
+def _resolve_command(opencode_path: str) -> List[str]:
+    """
+    Get the argument prefix used to launch opencode.
+    
+    An npm .cmd shim would otherwise start cmd.exe on every call, so it
+    is resolved to node plus the script the shim points at. Anything
+    that can't be resolved is executed directly.
+    
+    Args:
+        opencode_path: Path returned by _find_opencode
+    
+    Returns:
+        Command prefix, e.g. [node, script] or [opencode_path]
+    """
+    if not opencode_path.lower().endswith('.cmd'):
+        return [opencode_path]
+    
+    shim_dir = Path(opencode_path).parent
+    try:
+        match = _NPM_SHIM_SCRIPT.search(Path(opencode_path).read_text(errors='replace'))
+    except OSError:
+        match = None
+    if not match:
+        return [opencode_path]
+    
+    script = shim_dir.joinpath(*match.group(1).split('\\'))
+    local_node = shim_dir / 'node.exe'
+    node = str(local_node) if local_node.exists() else shutil.which('node')
+    if not node or not script.exists():
+        return [opencode_path]
+    
+    return [node, str(script)]
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_opencode() -> Tuple[str, Tuple[str, ...]]:
+    """
+    Locate opencode once per process.
+    
+    Returns:
+        Tuple of (opencode path, command prefix used to launch it)
+    """
+    opencode_path = _find_opencode()
+    return opencode_path, tuple(_resolve_command(opencode_path))
 
 
 class OpenCodeClient:
@@ -25,24 +93,70 @@ class OpenCodeClient:
         """
         self.working_dir = working_dir or Path.cwd()
         
-        # Find opencode executable
-        self.opencode_path = self._find_opencode()
+        # Find opencode executable and the argument prefix that launches it
+        opencode_path, command = _resolve_opencode()
+        self.opencode_path = opencode_path
+        self.command = list(command)
     
-    def _find_opencode(self) -> str:
-        """Find the opencode executable path."""
-        # Try to find in PATH
-        opencode_path = shutil.which("opencode")
-        if opencode_path:
-            return opencode_path
+    @staticmethod
+    async def _drain(stream: asyncio.StreamReader) -> bytearray:
+        """Read a subprocess stream to EOF in fixed-size chunks."""
+        buffer = bytearray()
+        while True:
+            chunk = await stream.read(READ_CHUNK_SIZE)
+            if not chunk:
+                return buffer
+            buffer += chunk
+    
+    async def _run(self, cmd: List[str], prompt: str, cwd: Path, timeout: float):
+        """
+        Run opencode with the prompt on stdin and collect its output.
         
-        # Common installation paths on Windows
-        if os.name == 'nt':
-            npm_path = Path(os.environ.get('APPDATA', '')) / 'npm' / 'opencode.cmd'
-            if npm_path.exists():
-                return str(npm_path)
+        Args:
+            cmd: Command to execute
+            prompt: Prompt written to stdin
+            cwd: Working directory
+            timeout: Seconds before the process is killed
+            
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(cwd)
+        )
+        
+        # Drain both pipes while stdin is written so neither side can block
+        stdout_task = asyncio.ensure_future(self._drain(process.stdout))
+        stderr_task = asyncio.ensure_future(self._drain(process.stderr))
         
-        # Default to hoping it's in PATH
-        return "opencode"
+        async def feed_and_wait():
+            try:
+                process.stdin.write(prompt.encode('utf-8'))
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            process.stdin.close()
+            return await asyncio.gather(process.wait(), stdout_task, stderr_task)
+        
+        try:
+            return await asyncio.wait_for(feed_and_wait(), timeout=timeout)
+        finally:
+            # Also reached when the caller is cancelled, not just on timeout
+            if process.returncode is None:
+                stdout_task.cancel()
+                stderr_task.cancel()
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+                # Close the pipes before reaping: grandchildren can hold
+                # them open, and wait() may not return until they close
+                process._transport.close()
+                await process.wait()
     
     async def query_model(
         self,
@@ -65,57 +179,15 @@ class OpenCodeClient:
         """
         cwd = working_dir or self.working_dir
         
-        # Check if prompt is too long for command line (Windows limit ~8192 chars)
-        use_stdin = len(prompt) > MAX_CMD_LENGTH
-        
         try:
-            if use_stdin:
-                # For long prompts, use stdin to pass the prompt
-                cmd = [self.opencode_path, "run", "-m", model]
-                
-                # Use subprocess with stdin
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdin=asyncio.subprocess.PIPE,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=str(cwd)
-                )
-                
-                # Write prompt to stdin
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(input=prompt.encode('utf-8')),
-                    timeout=timeout
-                )
-            elif os.name == 'nt' and self.opencode_path.endswith('.cmd'):
-                # On Windows, run through shell for .cmd files
-                process = await asyncio.create_subprocess_shell(
-                    f'"{self.opencode_path}" run -m {model} "{prompt}"',
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=str(cwd)
-                )
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout
-                )
-            else:
-                # Build the opencode run command with prompt as argument
-                cmd = [self.opencode_path, "run", "-m", model, prompt]
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=str(cwd)
-                )
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
-                    timeout=timeout
-                )
+            # The prompt always goes through stdin: no command line length
+            # limit, no shell quoting, and one code path on every platform
+            cmd = [*self.command, "run", "-m", model]
+            returncode, stdout, stderr = await self._run(cmd, prompt, cwd, timeout)
             
-            if process.returncode != 0:
+            if returncode != 0:
                 error_msg = stderr.decode('utf-8', errors='replace')
-                logger.error(f"OpenCode error for model {model}: {error_msg[:200]}")
+                logger.error("OpenCode error for model {}: {}", model, error_msg[:200])
                 return None
             
             content = stdout.decode('utf-8', errors='replace')
@@ -126,13 +198,13 @@ class OpenCodeClient:
             }
             
         except asyncio.TimeoutError:
-            logger.error(f"Timeout querying model {model} via OpenCode")
+            logger.error("Timeout querying model {} via OpenCode", model)
             return None
         except FileNotFoundError:
-            logger.error(f"OpenCode CLI not found. Please install opencode: npm install -g opencode-ai")
+            logger.error("OpenCode CLI not found. Please install opencode: npm install -g opencode-ai")
             return None
         except Exception as e:
-            logger.error(f"Error querying model {model} via OpenCode: {e}")
+            logger.error("Error querying model {} via OpenCode: {}", model, e)
             return None
     
     async def query_model_in_worktree(
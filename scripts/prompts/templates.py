@@ -1,5 +1,8 @@
 """Prompt templates for LLM Council."""
 
+from string import Formatter
+from typing import Optional, Tuple
+
 # Stage 1: Initial response prompt
 STAGE1_PROMPT = """You are a council member evaluating the following request:
 
@@ -127,3 +130,56 @@ Your task as Chairman is to create the final, best code changes that should be a
 - Best practices and code quality
 
 Provide the final code changes that represent the council's collective decision."""
+
+# Conversation title prompt
+TITLE_PROMPT = """Generate a very short title (3-5 words maximum) that summarizes the following question.
+The title should be concise and descriptive. Do not use quotes or punctuation in the title.
+Respond with ONLY the title, nothing else.
+
+Question: {query}
+
+Title:"""
+
+
+def compile_prompt(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Split a prompt template into (literal, field name) segments.
+    
+    Args:
+        template: str.format-style template
+        
+    Returns:
+        Segments for render_prompt; the last field name is None
+    """
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in Formatter().parse(template)
+    )
+
+
+def render_prompt(compiled: Tuple[Tuple[str, Optional[str]], ...], **fields: str) -> str:
+    """
+    Fill a compiled template without re-parsing it.
+    
+    Args:
+        compiled: Segments from compile_prompt
+        **fields: Field values; unused extras are ignored, as with str.format
+        
+    Returns:
+        The rendered prompt
+    """
+    parts = []
+    for literal, field_name in compiled:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(str(fields[field_name]))
+    return "".join(parts)
+
+
+# Templates are parsed once at import. Stage 1 sends the user's query
+# as-is, so STAGE1_PROMPT and CODE_STAGE1_PROMPT have no compiled form
+STAGE2_RANKING = compile_prompt(STAGE2_RANKING_PROMPT)
+STAGE3_SYNTHESIS = compile_prompt(STAGE3_SYNTHESIS_PROMPT)
+CODE_STAGE2_REVIEW = compile_prompt(CODE_STAGE2_REVIEW_PROMPT)
+CODE_STAGE3_SYNTHESIS = compile_prompt(CODE_STAGE3_SYNTHESIS_PROMPT)
+TITLE = compile_prompt(TITLE_PROMPT)
@@ -1,13 +1,69 @@
 """Storage for conversation history."""
 
+import os
 import json
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 
+from logger import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON (compact unless pretty), using orjson when available."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS stringifies int keys the way json.dumps does
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _dumps_line(data: Any) -> bytes:
+    """Serialize to a single newline-terminated JSON line."""
+    return _dumps(data) + b'\n'
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write a file via a temp file and os.replace so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ConversationStorage:
-    """Manages conversation storage in JSON files."""
+    """
+    Manages conversation storage in JSON files.
+    
+    Each conversation is a small metadata file ({id}.json: id, created_at,
+    title, session_count) plus an append-only {id}.sessions.jsonl with one
+    session per line. Older files that embed a "sessions" list are still
+    read, and are split on their next add_session.
+    
+    _index.json mirrors every conversation's metadata, keyed by file name,
+    so listing reads a single file. Metadata files that couldn't be read
+    are recorded in it too, so they aren't retried on every listing. It is
+    rebuilt from the metadata files whenever it is missing or lists a
+    different set of files than the directory.
+    """
+    
+    INDEX_NAME = "_index.json"
     
     def __init__(self, conversations_dir: Path):
         """
@@ -16,13 +72,115 @@ class ConversationStorage:
         Args:
             conversations_dir: Directory to store conversation files
         """
-        self.conversations_dir = Path(conversations_dir)
-        self.conversations_dir.mkdir(parents=True, exist_ok=True)
+        if not isinstance(conversations_dir, Path):
+            conversations_dir = Path(conversations_dir)
+        self.conversations_dir = conversations_dir
+        # Config usually creates the directory already; only mkdir if missing
+        if not self.conversations_dir.is_dir():
+            self.conversations_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.conversations_dir / self.INDEX_NAME
+        
+        # (directory mtime_ns, listing) from the last list_conversations
+        self._list_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
     
     def _get_conversation_path(self, conversation_id: str) -> Path:
         """Get the file path for a conversation."""
         return self.conversations_dir / f"{conversation_id}.json"
     
+    def _get_sessions_path(self, conversation_id: str) -> Path:
+        """Get the sessions file path for a conversation."""
+        return self.conversations_dir / f"{conversation_id}.sessions.jsonl"
+    
+    def _read_metadata(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Load a conversation's metadata file, or None if not found."""
+        path = self._get_conversation_path(conversation_id)
+        
+        if not path.exists():
+            return None
+        
+        with open(path, 'rb') as f:
+            return _loads(f.read())
+    
+    def _write_metadata(self, metadata: Dict[str, Any]):
+        """Write a conversation's metadata file and its index entry."""
+        _atomic_write(self._get_conversation_path(metadata['id']), _dumps(metadata))
+        self._update_index(metadata)
+    
+    def _update_index(self, metadata: Dict[str, Any]):
+        """
+        Update a conversation's entry in the metadata index.
+        
+        This is an unlocked read-modify-write. If two processes update the
+        index at once, one entry can keep a stale title or session_count;
+        the listing only rebuilds when files are added or removed.
+        """
+        index = self._read_index() or {"conversations": {}, "skipped": {}}
+        index["conversations"][metadata['id']] = self._index_entry(metadata)
+        index["skipped"].pop(metadata['id'], None)
+        self._write_index(index)
+        self._list_cache = None
+    
+    @staticmethod
+    def _index_entry(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the listing fields for a conversation's metadata."""
+        return {
+            "id": metadata["id"],
+            "created_at": metadata["created_at"],
+            "title": metadata.get("title", "New Council Session"),
+            "session_count": metadata.get("session_count", len(metadata.get("sessions", [])))
+        }
+    
+    def _read_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Load the metadata index, or None if missing or unreadable.
+        
+        Returns:
+            Dict with 'conversations' (file name -> listing fields) and
+            'skipped' (file name -> mtime_ns of an unreadable metadata file)
+        """
+        try:
+            with open(self.index_path, 'rb') as f:
+                index = _loads(f.read())
+            if isinstance(index["conversations"], dict) and isinstance(index["skipped"], dict):
+                return index
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+        # Missing, corrupt, or the list format of older versions
+        return None
+    
+    def _write_index(self, index: Dict[str, Dict[str, Any]]):
+        """Write the metadata index."""
+        _atomic_write(self.index_path, _dumps(index))
+    
+    def _metadata_mtime(self, conversation_id: str) -> Optional[int]:
+        """Get a metadata file's mtime_ns, or None if it can't be stat'ed."""
+        try:
+            return os.stat(self._get_conversation_path(conversation_id)).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _iter_sessions(self, conversation_id: str, metadata: Dict[str, Any]):
+        """
+        Yield a conversation's sessions in order.
+        
+        Args:
+            conversation_id: Unique identifier for the conversation
+            metadata: Its metadata (may hold legacy embedded sessions)
+        """
+        yield from metadata.get("sessions", [])
+        
+        path = self._get_sessions_path(conversation_id)
+        if not path.exists():
+            return
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield _loads(line)
+                except ValueError:
+                    pass  # Skip a torn line from an interrupted write
+    
     def create_conversation(self, conversation_id: str, title: str = "New Council Session") -> Dict[str, Any]:
         """
         Create a new conversation.
@@ -34,48 +192,130 @@ class ConversationStorage:
         Returns:
             New conversation dict
         """
-        conversation = {
+        metadata = {
             "id": conversation_id,
             "created_at": datetime.utcnow().isoformat(),
             "title": title,
-            "sessions": []
+            "session_count": 0
         }
         
         # Save to file
-        path = self._get_conversation_path(conversation_id)
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(conversation, f, indent=2, ensure_ascii=False)
+        self._write_metadata(metadata)
         
-        return conversation
+        return {**metadata, "sessions": []}
     
-    def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+    def get_conversation(
+        self,
+        conversation_id: str,
+        load_sessions: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """
         Load a conversation from storage.
         
         Args:
             conversation_id: Unique identifier for the conversation
+            load_sessions: Also read the sessions file (metadata only if False)
             
         Returns:
             Conversation dict or None if not found
         """
-        path = self._get_conversation_path(conversation_id)
+        metadata = self._read_metadata(conversation_id)
         
-        if not path.exists():
+        if metadata is None:
             return None
         
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        conversation = {k: v for k, v in metadata.items() if k != "sessions"}
+        if load_sessions:
+            conversation["sessions"] = list(self._iter_sessions(conversation_id, metadata))
+            conversation["session_count"] = len(conversation["sessions"])
+        else:
+            conversation.setdefault("session_count", len(metadata.get("sessions", [])))
+        return conversation
+    
+    def get_conversation_summary(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a lightweight view of a conversation for display.
+        
+        Only the fields rendered by --show are kept; sessions are read one
+        line at a time and their stage1/stage2 results dropped right away.
+        
+        Args:
+            conversation_id: Unique identifier for the conversation
+            
+        Returns:
+            Dict with 'id', 'title', 'created_at' and 'sessions' (each with
+            'timestamp', 'query', 'stage3_response'), or None if not found
+        """
+        metadata = self._read_metadata(conversation_id)
+        
+        if metadata is None:
+            return None
+        
+        sessions = []
+        for session in self._iter_sessions(conversation_id, metadata):
+            stage3 = session.get("results", {}).get("stage3") or {}
+            sessions.append({
+                "timestamp": session.get("timestamp", ""),
+                "query": session.get("query", ""),
+                "stage3_response": stage3.get("response", "") if stage3 else None
+            })
+        
+        return {
+            "id": metadata["id"],
+            "title": metadata.get("title", "New Council Session"),
+            "created_at": metadata["created_at"],
+            "sessions": sessions
+        }
+    
+    def export_conversation(self, conversation_id: str, pretty: bool = True) -> Optional[str]:
+        """
+        Render a full conversation as JSON text.
+        
+        Files on disk are compact; use this for a human-readable copy.
+        
+        Args:
+            conversation_id: Unique identifier for the conversation
+            pretty: Indent the output
+            
+        Returns:
+            JSON string or None if not found
+        """
+        conversation = self.get_conversation(conversation_id)
+        
+        if conversation is None:
+            return None
+        
+        return _dumps(conversation, pretty=pretty).decode('utf-8')
     
     def save_conversation(self, conversation: Dict[str, Any]):
         """
-        Save a conversation to storage.
+        Save a conversation to storage, rewriting its sessions file.
         
         Args:
             conversation: Conversation dict to save
         """
-        path = self._get_conversation_path(conversation['id'])
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(conversation, f, indent=2, ensure_ascii=False)
+        self._update_index(self._write_conversation_files(conversation))
+    
+    def _write_conversation_files(self, conversation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Write a conversation's sessions and metadata files, leaving the index alone.
+        
+        Args:
+            conversation: Conversation dict to write
+            
+        Returns:
+            The metadata that was written
+        """
+        sessions = conversation.get("sessions", [])
+        _atomic_write(
+            self._get_sessions_path(conversation['id']),
+            b''.join(_dumps_line(session) for session in sessions)
+        )
+        
+        metadata = {k: v for k, v in conversation.items() if k != "sessions"}
+        metadata["session_count"] = len(sessions)
+        _atomic_write(self._get_conversation_path(metadata['id']), _dumps(metadata))
+        return metadata
     
     def add_session(
         self,
@@ -93,17 +333,22 @@ class ConversationStorage:
             council_results: Results from the council process
             title: Optional title for the conversation (auto-generated or user-provided)
         """
-        conversation = self.get_conversation(conversation_id)
+        metadata = self._read_metadata(conversation_id)
         
-        if conversation is None:
+        if metadata is None:
             # Use provided title or default
-            conversation = self.create_conversation(
+            metadata = self.create_conversation(
                 conversation_id, 
                 title=title or "New Council Session"
             )
-        elif title:
+        elif "sessions" in metadata:
+            # Legacy single-file conversation: split it once
+            self.save_conversation(metadata)
+            metadata = self._read_metadata(conversation_id)
+        
+        if title:
             # Update title if provided and this is an existing conversation
-            conversation["title"] = title
+            metadata["title"] = title
         
         session = {
             "timestamp": datetime.utcnow().isoformat(),
@@ -111,30 +356,51 @@ class ConversationStorage:
             "results": council_results
         }
         
-        conversation["sessions"].append(session)
-        self.save_conversation(conversation)
+        # Only the new session is written; the metadata file stays small
+        with open(self._get_sessions_path(conversation_id), 'ab') as f:
+            f.write(_dumps_line(session))
+        
+        metadata.pop("sessions", None)
+        metadata["session_count"] = metadata.get("session_count", 0) + 1
+        self._write_metadata(metadata)
     
-    def list_conversations(self) -> List[Dict[str, Any]]:
+    def list_conversations(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         List all conversations (metadata only), sorted by newest first.
         
+        Only the metadata files are parsed; session files are never read.
+        The result is cached until the directory's mtime changes or this
+        instance writes metadata.
+        
+        Args:
+            limit: Return at most this many of the newest conversations
+            
         Returns:
             List of conversation metadata dicts with 'index' field (1-based)
         """
-        conversations = []
+        mtime = os.stat(self.conversations_dir).st_mtime_ns
+        if self._list_cache is None or self._list_cache[0] != mtime:
+            self._list_cache = (mtime, self._scan_conversations())
         
-        for path in self.conversations_dir.glob("*.json"):
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    conversations.append({
-                        "id": data["id"],
-                        "created_at": data["created_at"],
-                        "title": data.get("title", "New Council Session"),
-                        "session_count": len(data.get("sessions", []))
-                    })
-            except Exception:
-                pass  # Silently skip corrupted files
+        # Copies, so callers can't alter the cached listing
+        return [dict(conv) for conv in self._list_cache[1][:limit]]
+    
+    def _scan_conversations(self) -> List[Dict[str, Any]]:
+        """Build the sorted, indexed listing from the metadata index."""
+        with os.scandir(self.conversations_dir) as entries:
+            conversation_ids = {
+                entry.name[:-len(".json")]
+                for entry in entries
+                if entry.name.endswith(".json")
+                and entry.name != self.INDEX_NAME
+                and entry.is_file()  # d_type from the scan, no extra stat
+            }
+        
+        index = self._read_index()
+        if index is None or not self._index_matches(index, conversation_ids):
+            index = self._rebuild_index(conversation_ids, index)
+        
+        conversations = [dict(entry) for entry in index["conversations"].values()]
         
         # Sort by created_at (newest first)
         conversations.sort(key=lambda x: x["created_at"], reverse=True)
@@ -145,6 +411,70 @@ class ConversationStorage:
         
         return conversations
     
+    def _index_matches(self, index: Dict[str, Dict[str, Any]], conversation_ids) -> bool:
+        """
+        Check whether the index covers exactly the metadata files on disk.
+        
+        Args:
+            index: Index from _read_index()
+            conversation_ids: Ids of the metadata files present on disk
+            
+        Returns:
+            True if every file is listed or skipped and no skipped file changed
+        """
+        skipped = index["skipped"]
+        if index["conversations"].keys() | skipped.keys() != conversation_ids:
+            return False
+        # Give a skipped file another try once it has been rewritten
+        return all(
+            self._metadata_mtime(conversation_id) == mtime
+            for conversation_id, mtime in skipped.items()
+        )
+    
+    def _rebuild_index(self, conversation_ids, current=None) -> Dict[str, Dict[str, Any]]:
+        """
+        Recreate the metadata index by reading every metadata file.
+        
+        Args:
+            conversation_ids: Ids of the metadata files present on disk
+            current: The index already on disk, if any; not rewritten when unchanged
+            
+        Returns:
+            The new index
+        """
+        conversations = {}
+        skipped = {}
+        
+        for conversation_id in conversation_ids:
+            mtime = self._metadata_mtime(conversation_id)
+            try:
+                data = self._read_metadata(conversation_id)
+                conversations[conversation_id] = self._index_entry(data)
+            except (OSError, ValueError, TypeError, KeyError) as e:
+                logger.warning("Skipping unreadable conversation {}: {}", conversation_id, e)
+                skipped[conversation_id] = mtime
+                continue
+            
+            if "sessions" in data and data["id"] == conversation_id:
+                # Legacy single-file conversation: split it so the metadata
+                # file stays small. It still reads fine unsplit, so a failed
+                # write (e.g. read-only data dir) only costs the migration.
+                try:
+                    self._write_conversation_files(data)
+                except OSError as e:
+                    logger.warning("Could not migrate conversation {}: {}", conversation_id, e)
+        
+        index = {"conversations": conversations, "skipped": skipped}
+        if index == current:
+            return index
+        
+        # Written once for the whole rebuild; the listing works without it
+        try:
+            self._write_index(index)
+        except OSError as e:
+            logger.warning("Could not write conversation index: {}", e)
+        return index
+    
     def get_conversation_by_index(self, index: int) -> Optional[Dict[str, Any]]:
         """
         Get a conversation by its list index (1-based).
@@ -155,12 +485,10 @@ class ConversationStorage:
         Returns:
             Full conversation dict or None if not found
         """
-        conversations = self.list_conversations()
-        
-        if index < 1 or index > len(conversations):
+        conversation_id = self.get_conversation_id_by_index(index)
+        if conversation_id is None:
             return None
         
-        conversation_id = conversations[index - 1]["id"]
         return self.get_conversation(conversation_id)
     
     def get_conversation_id_by_index(self, index: int) -> Optional[str]:
@@ -173,30 +501,35 @@ class ConversationStorage:
         Returns:
             Conversation ID or None if not found
         """
-        conversations = self.list_conversations()
+        if index < 1:
+            return None
         
-        if index < 1 or index > len(conversations):
+        conversations = self.list_conversations(limit=index)
+        if len(conversations) < index:
             return None
         
-        return conversations[index - 1]["id"]
+        return conversations[-1]["id"]
     
     def get_conversation_history(self, conversation_id: str) -> List[Dict[str, str]]:
         """
         Get the conversation history as a list of messages for context.
         
+        Sessions are streamed from the sessions file, so only one session's
+        full results are in memory at a time.
+        
         Args:
             conversation_id: Unique identifier for the conversation
             
         Returns:
             List of message dicts with 'role' and 'content' keys
         """
-        conversation = self.get_conversation(conversation_id)
+        metadata = self._read_metadata(conversation_id)
         
-        if conversation is None:
+        if metadata is None:
             return []
         
         messages = []
-        for session in conversation.get("sessions", []):
+        for session in self._iter_sessions(conversation_id, metadata):
             # Add user query
             messages.append({
                 "role": "user",
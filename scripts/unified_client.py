@@ -6,10 +6,18 @@ from pathlib import Path
 
 from logger import logger, get_member_logger
 from opencode_client import OpenCodeClient
+from config import member_id_for
 
 if TYPE_CHECKING:
     from dashboard import CouncilDashboard, MemberStatus
 
+# Prompt prefix per message role; other roles are left out of the prompt
+_ROLE_PREFIX = {
+    "system": "[System]: ",
+    "user": "",
+    "assistant": "[Assistant]: ",
+}
+
 
 class UnifiedLLMClient:
     """
@@ -25,7 +33,8 @@ class UnifiedLLMClient:
     def __init__(
         self,
         working_dir: Optional[Path] = None,
-        dashboard: Optional["CouncilDashboard"] = None
+        dashboard: Optional["CouncilDashboard"] = None,
+        max_concurrent: int = 8
     ):
         """
         Initialize the unified client.
@@ -33,13 +42,39 @@ class UnifiedLLMClient:
         Args:
             working_dir: Working directory for OpenCode
             dashboard: Optional dashboard for live updates
+            max_concurrent: Max members queried at once by query_members_parallel
         """
         self.opencode_client = OpenCodeClient(working_dir=working_dir)
-        self.dashboard = dashboard
+        self.max_concurrent = max_concurrent
+        
+        # Status name -> MemberStatus, built once a dashboard is attached
+        self._status_map: Optional[Dict[str, "MemberStatus"]] = None
+        self.set_dashboard(dashboard)
+        
+        # Bound member loggers, keyed by member_id
+        self._member_loggers: Dict[str, Any] = {}
+    
+    @staticmethod
+    def _member_id(member: Dict[str, str]) -> str:
+        """Get a member's id, computed at config load (see member_id_for)."""
+        return member.get("member_id") or member_id_for(member["full_name"])
+    
+    def _get_member_logger(self, member_id: str, full_name: str):
+        """Get the member's bound logger, creating it on first use."""
+        member_logger = self._member_loggers.get(member_id)
+        if member_logger is None:
+            member_logger = get_member_logger(member_id, full_name)
+            self._member_loggers[member_id] = member_logger
+        return member_logger
     
     def set_dashboard(self, dashboard: Optional["CouncilDashboard"]) -> None:
         """Set the dashboard for live updates."""
         self.dashboard = dashboard
+        
+        if dashboard is not None and self._status_map is None:
+            # Imported here so the client works without rich installed
+            from dashboard import MemberStatus
+            self._status_map = {status.value: status for status in MemberStatus}
     
     def _notify_dashboard(
         self,
@@ -53,17 +88,7 @@ class UnifiedLLMClient:
         if self.dashboard is None:
             return
         
-        from dashboard import MemberStatus
-        
-        status_map = {
-            "active": MemberStatus.ACTIVE,
-            "waiting": MemberStatus.WAITING,
-            "completed": MemberStatus.COMPLETED,
-            "error": MemberStatus.ERROR,
-            "idle": MemberStatus.IDLE,
-        }
-        
-        member_status = status_map.get(status) if status else None
+        member_status = self._status_map.get(status) if status else None
         self.dashboard.update_member(
             member_id,
             status=member_status,
@@ -71,7 +96,6 @@ class UnifiedLLMClient:
             api_calls_delta=api_calls_delta,
             error=error
         )
-        self.dashboard.refresh()
     
     async def query_member(
         self,
@@ -89,6 +113,29 @@ class UnifiedLLMClient:
             working_dir: Working directory for OpenCode
             timeout: Request timeout
             
+        Returns:
+            Response dict with 'content' and 'model', or None if failed
+        """
+        # Convert messages to a single prompt for OpenCode
+        prompt = self._messages_to_prompt(messages)
+        return await self._query_member_with_prompt(member, prompt, working_dir, timeout)
+    
+    async def _query_member_with_prompt(
+        self,
+        member: Dict[str, str],
+        prompt: str,
+        working_dir: Optional[Path] = None,
+        timeout: float = 300.0
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Query a council member with an already-built prompt.
+        
+        Args:
+            member: Dict with 'provider', 'model', 'full_name' keys
+            prompt: Prompt from _messages_to_prompt
+            working_dir: Working directory for OpenCode
+            timeout: Request timeout
+            
         Returns:
             Response dict with 'content' and 'model', or None if failed
         """
@@ -97,27 +144,24 @@ class UnifiedLLMClient:
         full_name = member["full_name"]
         
         # Create a stable member_id for dashboard
-        member_id = full_name.replace("/", "_").replace(":", "_")
+        member_id = self._member_id(member)
         
-        logger.info(f"  → Querying {full_name}...")
+        logger.info("  → Querying {}...", full_name)
         
         # Get member-specific logger for detailed logging
-        member_logger = get_member_logger(member_id, full_name)
-        member_logger.info(f"Starting query for {full_name}")
-        member_logger.debug(f"Provider: {provider}, Model: {model}")
+        member_logger = self._get_member_logger(member_id, full_name)
+        member_logger.info("Starting query for {}", full_name)
+        member_logger.debug("Provider: {}, Model: {}", provider, model)
         
         # Notify dashboard - starting query
         self._notify_dashboard(member_id, status="active", activity="Sending request...")
         
         if provider != "opencode":
-            logger.error(f"Unknown provider: {provider}. Only 'opencode' is supported.")
-            member_logger.error(f"Unknown provider: {provider}")
+            logger.error("Unknown provider: {}. Only 'opencode' is supported.", provider)
+            member_logger.error("Unknown provider: {}", provider)
             self._notify_dashboard(member_id, status="error", error=f"Unknown provider: {provider}")
             return None
         
-        # Convert messages to a single prompt for OpenCode
-        prompt = self._messages_to_prompt(messages)
-        
         # Notify dashboard - processing
         self._notify_dashboard(member_id, activity="Waiting for response...", api_calls_delta=1)
         
@@ -130,31 +174,25 @@ class UnifiedLLMClient:
         
         if response:
             response["full_name"] = full_name
-            logger.success(f"  ✓ {full_name} completed")
-            member_logger.success(f"Query completed successfully")
-            member_logger.debug(f"Response length: {len(response.get('content', ''))} chars")
+            logger.success("  ✓ {} completed", full_name)
+            member_logger.success("Query completed successfully")
+            member_logger.opt(lazy=True).debug(
+                "Response length: {} chars", lambda: len(response.get("content", ""))
+            )
             self._notify_dashboard(member_id, status="completed", activity="Response received")
         else:
-            logger.warning(f"  ✗ {full_name} failed")
+            logger.warning("  ✗ {} failed", full_name)
             member_logger.error("Query failed - no response")
             self._notify_dashboard(member_id, status="error", error="No response received")
         return response
     
     def _messages_to_prompt(self, messages: List[Dict[str, str]]) -> str:
         """Convert OpenAI-style messages to a single prompt string."""
-        prompt_parts = []
-        for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            
-            if role == "system":
-                prompt_parts.append(f"[System]: {content}")
-            elif role == "user":
-                prompt_parts.append(content)
-            elif role == "assistant":
-                prompt_parts.append(f"[Assistant]: {content}")
-        
-        return "\n\n".join(prompt_parts)
+        return "\n\n".join([
+            _ROLE_PREFIX[msg.get("role", "user")] + msg.get("content", "")
+            for msg in messages
+            if msg.get("role", "user") in _ROLE_PREFIX
+        ])
     
     async def query_members_parallel(
         self,
@@ -178,33 +216,55 @@ class UnifiedLLMClient:
         # Notify dashboard - all members waiting
         if self.dashboard:
             for member in members:
-                member_id = member["full_name"].replace("/", "_").replace(":", "_")
+                member_id = self._member_id(member)
                 self._notify_dashboard(member_id, status="waiting", activity="Queued...")
         
-        tasks = []
+        # Created per call: a semaphore binds to the running event loop on
+        # Python < 3.10, and each council run uses a fresh loop
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        async def bounded(key, coro):
+            async with semaphore:
+                return key, await coro
+        
+        # Every member gets the same prompt; build it once
+        prompt = self._messages_to_prompt(messages)
+        
+        # Members that share
+        # provider, model and working directory would make identical calls,
+        # so query each distinct combination once
+        tasks = {}
+        member_keys = []
         for i, member in enumerate(members):
             working_dir = working_dirs.get(i) if working_dirs else None
-            tasks.append(
-                self.query_member(
+            key = (member["provider"], member["model"], working_dir)
+            member_keys.append(key)
+            if key not in tasks:
+                tasks[key] = bounded(key, self._query_member_with_prompt(
                     member=member,
-                    messages=messages,
+                    prompt=prompt,
                     working_dir=working_dir,
                     timeout=timeout
-                )
-            )
+                ))
         
-        responses = await asyncio.gather(*tasks)
-        
-        # Build results list, filtering out None
-        results = []
-        for i, (member, response) in enumerate(zip(members, responses)):
-            if response is not None:
-                results.append({
-                    "member_index": i,
-                    "model": member["model"],
-                    "provider": member["provider"],
-                    "full_name": member["full_name"],
-                    "response": response
-                })
-        
-        return results
+        # Collect responses in completion order; member order is restored below
+        unique_responses = {}
+        for finished in asyncio.as_completed(list(tasks.values())):
+            key, response = await finished
+            unique_responses[key] = response
+            logger.debug("{}/{} member queries finished", len(unique_responses), len(tasks))
+        
+        # Build results list in member order, filtering out None
+        return [
+            {
+                "member_index": i,
+                "model": member["model"],
+                "provider": member["provider"],
+                "full_name": member["full_name"],
+                "response": dict(response)
+            }
+            for i, (member, response) in enumerate(
+                zip(members, map(unique_responses.__getitem__, member_keys))
+            )
+            if response is not None
+        ]
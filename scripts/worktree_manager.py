@@ -1,14 +1,79 @@
 """Git worktree management for LLM Council members."""
 
+import os
 import subprocess
+import sys
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Iterator, Optional, Set, Tuple, Any
 import hashlib
 import re
+import string
 
 from logger import logger
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Read size when streaming git output
+READ_CHUNK_SIZE = 65536
+
+# ioctl request for a copy-on-write clone (fcntl.FICLONE only exists on
+# 3.12+). The number is Linux's; other platforms with fcntl use it for
+# something else, so reflinks are only tried on Linux
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if sys.platform == "linux" else None
+
+# Our descriptors are non-inheritable (PEP 446), so on Linux git children
+# can skip the close-everything pass over the fd table on each spawn
+CLOSE_FDS = sys.platform != "linux"
+
+# Author/committer/date metadata stripped from diffs before review
+_IDENTITY_LINE_RE = re.compile(r"(?:Author|Committer|Date):.*\n")
+
+# Characters allowed as-is in generated branch names
+_BRANCH_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+class _BranchSafeTable(dict):
+    """str.translate table mapping anything outside [a-zA-Z0-9_-] to "_"."""
+
+    def __missing__(self, code: int):
+        value = code if chr(code) in _BRANCH_SAFE_CHARS else "_"
+        self[code] = value
+        return value
+
+
+_BRANCH_SAFE_TABLE = _BranchSafeTable()
+
+
+def _copy_file_content(src: Path, dst: Path):
+    """
+    Copy a file's content and permission bits (not its timestamps).
+
+    Tries a copy-on-write reflink first on Linux (btrfs, XFS), then
+    shutil.copyfile, which copies in-kernel with sendfile on Linux.
+
+    Args:
+        src: File to copy
+        dst: Destination path, overwritten if it exists
+    """
+    if FICLONE is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            pass  # No reflink support on this filesystem
+        else:
+            shutil.copymode(src, dst)
+            return
+
+    shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+
 
 class WorktreeManager:
     """Manages git worktrees for council members."""
@@ -25,19 +90,34 @@ class WorktreeManager:
         self.worktrees_dir = Path(worktrees_dir)
         self.worktrees_dir.mkdir(parents=True, exist_ok=True)
 
+        # Branch checked out in each worktree this manager created, so later
+        # operations don't have to spawn git to ask for it
+        self._worktree_branches: Dict[str, str] = {}
+
+        # Anonymous label per member_id, reused across diffs
+        self._anon_labels: Dict[str, str] = {}
+
+        # Whether each worktree's HEAD resolves, learned from the first diff
+        # so later diffs skip the failing `diff HEAD` attempt
+        self._worktree_has_head: Dict[str, bool] = {}
+
+        # Name of the repository's main branch, looked up once
+        self._main_branch: Optional[str] = None
+
         # Verify we're in a git repository
         if not (self.repo_root / ".git").exists():
             raise ValueError(f"{self.repo_root} is not a git repository")
 
     def _run_git_command(
-        self, args: List[str], cwd: Optional[Path] = None
-    ) -> Tuple[int, str, str]:
+        self, args: List[str], cwd: Optional[Path] = None, as_bytes: bool = False
+    ) -> Tuple[int, Any, Any]:
         """
         Run a git command and return the result.
 
         Args:
             args: Git command arguments
             cwd: Working directory (defaults to repo_root)
+            as_bytes: Return stdout and stderr as raw bytes instead of text
 
         Returns:
             Tuple of (returncode, stdout, stderr)
@@ -45,15 +125,41 @@ class WorktreeManager:
         if cwd is None:
             cwd = self.repo_root
 
-        result = subprocess.run(
-            ["git"] + args,
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-        )
+        if as_bytes:
+            result = subprocess.run(
+                ["git"] + args,
+                cwd=str(cwd),
+                capture_output=True,
+                close_fds=CLOSE_FDS,
+            )
+        else:
+            result = subprocess.run(
+                ["git"] + args,
+                cwd=str(cwd),
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                close_fds=CLOSE_FDS,
+            )
         return result.returncode, result.stdout, result.stderr
 
+    def _get_main_branch(self) -> str:
+        """
+        Get the name of the main branch ("main", or "master" if there is none).
+
+        The answer only changes if branches are renamed under us, so it is
+        queried once per manager.
+
+        Returns:
+            Branch name to switch to before applying changes
+        """
+        if self._main_branch is None:
+            returncode, stdout, stderr = self._run_git_command(
+                ["show-ref", "--verify", "--quiet", "refs/heads/main"]
+            )
+            self._main_branch = "main" if returncode == 0 else "master"
+        return self._main_branch
+
     def create_worktree(
         self, member_id: str, branch_name: Optional[str] = None
     ) -> Path:
@@ -70,15 +176,14 @@ class WorktreeManager:
         # Generate safe branch name
         if branch_name is None:
             # Create a unique branch name based on member_id and timestamp
-            safe_id = re.sub(r"[^a-zA-Z0-9_-]", "_", member_id)
+            safe_id = member_id.translate(_BRANCH_SAFE_TABLE)
             branch_name = f"council/{safe_id}"
 
         # Worktree path
         worktree_path = self.worktrees_dir / member_id
 
-        # Remove existing worktree if it exists
-        if worktree_path.exists():
-            self.remove_worktree(member_id)
+        # Remove existing worktree if it exists (remove_worktree checks)
+        self.remove_worktree(member_id)
 
         # Create the worktree (create new branch from HEAD)
         returncode, stdout, stderr = self._run_git_command(
@@ -94,8 +199,58 @@ class WorktreeManager:
             if returncode != 0:
                 raise RuntimeError(f"Failed to create worktree: {stderr}")
 
+        self._worktree_branches[member_id] = branch_name
         return worktree_path
 
+    def _worker_count(self, jobs: int) -> int:
+        """Number of threads to run a batch of independent git commands."""
+        return min(jobs, (os.cpu_count() or 1) * 2)
+
+    def create_worktrees_bulk(self, member_ids: List[str]) -> Dict[str, Path]:
+        """
+        Create worktrees for several council members in parallel.
+
+        Each `git worktree add` is an independent subprocess, so they are run
+        from a thread pool. Creations that fail (e.g. on a ref lock held by a
+        concurrent add) are retried once serially before giving up.
+
+        Args:
+            member_ids: Unique identifiers of the council members
+
+        Returns:
+            Dict of member_id to worktree path for the worktrees created
+        """
+        member_ids = list(dict.fromkeys(member_ids))
+        if not member_ids:
+            return {}
+
+        worktree_paths = {}
+        failed = []
+        with ThreadPoolExecutor(
+            max_workers=self._worker_count(len(member_ids))
+        ) as executor:
+            futures = {
+                member_id: executor.submit(self.create_worktree, member_id)
+                for member_id in member_ids
+            }
+            for member_id, future in futures.items():
+                try:
+                    worktree_paths[member_id] = future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Parallel worktree creation failed for {member_id}, "
+                        f"retrying serially: {e}"
+                    )
+                    failed.append(member_id)
+
+        for member_id in failed:
+            try:
+                worktree_paths[member_id] = self.create_worktree(member_id)
+            except Exception as e:
+                logger.error(f"Failed to create worktree for {member_id}: {e}")
+
+        return worktree_paths
+
     def remove_worktree(self, member_id: str, force: bool = True):
         """
         Remove a worktree for a council member.
@@ -105,6 +260,8 @@ class WorktreeManager:
             force: Force removal even if worktree has uncommitted changes
         """
         worktree_path = self.worktrees_dir / member_id
+        self._worktree_branches.pop(member_id, None)
+        self._worktree_has_head.pop(member_id, None)
 
         if not worktree_path.exists():
             return
@@ -116,10 +273,40 @@ class WorktreeManager:
 
         returncode, stdout, stderr = self._run_git_command(args)
 
-        if returncode != 0 and worktree_path.exists():
-            # If git command failed, manually remove the directory
+        if returncode != 0:
+            # If git command failed, manually remove whatever is left
             shutil.rmtree(worktree_path, ignore_errors=True)
 
+    def _track_new_files(self, worktree_path: Path) -> bool:
+        """
+        Prepare a worktree so that git diff also shows untracked files.
+
+        Untracked files are added to the index with --intent-to-add, which
+        lets git diff show them without actually staging them. One status
+        call decides whether that index write is needed at all.
+
+        Args:
+            worktree_path: Path to the worktree
+
+        Returns:
+            False if the worktree has no changes to diff
+        """
+        returncode, stdout, stderr = self._run_git_command(
+            # Explicit -u so status.showUntrackedFiles=no can't hide new files
+            ["status", "--porcelain", "-z", "--untracked-files=normal"],
+            cwd=worktree_path,
+            as_bytes=True,
+        )
+
+        if returncode == 0:
+            if not stdout:
+                return False
+            if not any(entry.startswith(b"?? ") for entry in stdout.split(b"\0")):
+                return True
+
+        self._run_git_command(["add", "-N", "."], cwd=worktree_path)
+        return True
+
     def get_worktree_diff(self, member_id: str) -> str:
         """
         Get the diff of changes in a worktree, including new (untracked) files.
@@ -135,22 +322,71 @@ class WorktreeManager:
         if not worktree_path.exists():
             raise ValueError(f"Worktree for {member_id} does not exist")
 
-        # First, add all untracked files to the index with --intent-to-add
-        # This allows git diff to show new files without actually staging them
-        self._run_git_command(["add", "-N", "."], cwd=worktree_path)
+        if not self._track_new_files(worktree_path):
+            return ""
 
         # Get diff of all changes (staged, unstaged, and newly tracked files)
+        # as bytes, decoded once so files that aren't UTF-8 can't break it
+        if self._worktree_has_head.get(member_id, True):
+            returncode, stdout, stderr = self._run_git_command(
+                ["diff", "HEAD"], cwd=worktree_path, as_bytes=True
+            )
+            self._worktree_has_head[member_id] = returncode == 0
+            if returncode == 0:
+                return stdout.decode("utf-8", errors="replace")
+
+        # No HEAD yet: get unstaged changes only
         returncode, stdout, stderr = self._run_git_command(
-            ["diff", "HEAD"], cwd=worktree_path
+            ["diff"], cwd=worktree_path, as_bytes=True
         )
 
-        if returncode != 0:
-            # Try getting unstaged changes only
-            returncode, stdout, stderr = self._run_git_command(
-                ["diff"], cwd=worktree_path
-            )
+        return stdout.decode("utf-8", errors="replace")
+
+    def iter_worktree_diff(self, member_id: str) -> Iterator[bytes]:
+        """
+        Stream the raw diff of a worktree, including new (untracked) files.
+
+        Unlike get_worktree_diff, the output is never decoded or held in
+        memory as a whole; it is yielded in chunks as git produces it.
+
+        Args:
+            member_id: Unique identifier for the council member
 
-        return stdout
+        Yields:
+            Chunks of git diff output
+        """
+        worktree_path = self.worktrees_dir / member_id
+
+        if not worktree_path.exists():
+            raise ValueError(f"Worktree for {member_id} does not exist")
+
+        if not self._track_new_files(worktree_path):
+            return
+
+        if self._worktree_has_head.get(member_id, True):
+            commands = (["diff", "HEAD"], ["diff"])
+        else:
+            commands = (["diff"],)
+
+        for args in commands:
+            produced = False
+            with subprocess.Popen(
+                ["git"] + args,
+                cwd=str(worktree_path),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                close_fds=CLOSE_FDS,
+            ) as process:
+                for chunk in iter(lambda: process.stdout.read(READ_CHUNK_SIZE), b""):
+                    produced = True
+                    yield chunk
+
+            # Fall back to unstaged changes only if `diff HEAD` failed outright
+            if process.returncode == 0 or produced:
+                if len(args) > 1:
+                    self._worktree_has_head[member_id] = True
+                return
+            self._worktree_has_head[member_id] = False
 
     def anonymize_diff(self, diff: str, member_id: str) -> str:
         """
@@ -164,18 +400,16 @@ class WorktreeManager:
             Anonymized diff
         """
         # Create a hash-based anonymous label
-        hash_obj = hashlib.md5(member_id.encode())
-        anon_label = f"Member_{hash_obj.hexdigest()[:8]}"
+        anon_label = self._anon_labels.get(member_id)
+        if anon_label is None:
+            digest = hashlib.blake2s(member_id.encode(), digest_size=4).hexdigest()
+            anon_label = self._anon_labels[member_id] = f"Member_{digest}"
 
         # Replace member_id with anonymous label
         anonymized = diff.replace(member_id, anon_label)
 
         # Remove any author/committer information
-        anonymized = re.sub(r"Author:.*\n", "", anonymized)
-        anonymized = re.sub(r"Committer:.*\n", "", anonymized)
-        anonymized = re.sub(r"Date:.*\n", "", anonymized)
-
-        return anonymized
+        return _IDENTITY_LINE_RE.sub("", anonymized)
 
     def commit_changes(self, member_id: str, message: str) -> bool:
         """
@@ -212,6 +446,8 @@ class WorktreeManager:
                 return False
             raise RuntimeError(f"Failed to commit changes: {stderr}")
 
+        # The worktree has a HEAD now even if it was unborn before
+        self._worktree_has_head[member_id] = True
         return True
 
     def apply_changes_to_main(self, member_id: str, strategy: str = "merge") -> bool:
@@ -231,23 +467,23 @@ class WorktreeManager:
             raise ValueError(f"Worktree for {member_id} does not exist")
 
         # Get the branch name from the worktree
-        returncode, branch_name, stderr = self._run_git_command(
-            ["rev-parse", "--abbrev-ref", "HEAD"], cwd=worktree_path
-        )
+        branch_name = self._worktree_branches.get(member_id)
+        if branch_name is None:
+            returncode, branch_name, stderr = self._run_git_command(
+                ["rev-parse", "--abbrev-ref", "HEAD"], cwd=worktree_path
+            )
 
-        if returncode != 0:
-            raise RuntimeError(f"Failed to get branch name: {stderr}")
+            if returncode != 0:
+                raise RuntimeError(f"Failed to get branch name: {stderr}")
 
-        branch_name = branch_name.strip()
+            branch_name = branch_name.strip()
 
         # Switch to main branch in repo root
-        returncode, stdout, stderr = self._run_git_command(["checkout", "main"])
+        main_branch = self._get_main_branch()
+        returncode, stdout, stderr = self._run_git_command(["checkout", main_branch])
 
         if returncode != 0:
-            # Try master if main doesn't exist
-            returncode, stdout, stderr = self._run_git_command(["checkout", "master"])
-            if returncode != 0:
-                raise RuntimeError(f"Failed to checkout main/master: {stderr}")
+            raise RuntimeError(f"Failed to checkout {main_branch}: {stderr}")
 
         # Apply changes
         if strategy == "merge":
@@ -261,15 +497,10 @@ class WorktreeManager:
                 ]
             )
         elif strategy == "cherry-pick":
-            # Get the commit hash from the worktree branch
-            returncode, commit_hash, stderr = self._run_git_command(
-                ["rev-parse", branch_name]
+            # cherry-pick resolves the branch to its tip commit itself
+            returncode, stdout, stderr = self._run_git_command(
+                ["cherry-pick", branch_name]
             )
-            if returncode == 0:
-                commit_hash = commit_hash.strip()
-                returncode, stdout, stderr = self._run_git_command(
-                    ["cherry-pick", commit_hash]
-                )
         else:
             raise ValueError(f"Unknown strategy: {strategy}")
 
@@ -297,44 +528,51 @@ class WorktreeManager:
         if not worktree_path.exists():
             raise ValueError(f"Worktree for {member_id} does not exist")
 
-        # Get the diff from worktree
-        diff = self.get_worktree_diff(member_id)
+        # Spool the diff from the worktree to a temp file that git apply
+        # reads directly, so it is never held in memory
+        with tempfile.TemporaryFile() as patch:
+            for chunk in self.iter_worktree_diff(member_id):
+                patch.write(chunk)
 
-        if not diff:
-            logger.info(f"No changes to apply from {member_id}")
-            return False
+            if not patch.tell():
+                logger.info(f"No changes to apply from {member_id}")
+                return False
 
-        # Apply the diff to main repository using git apply
-        # This applies the patch without committing
-        import subprocess
-
-        # First try with --3way for better conflict handling
-        result = subprocess.run(
-            ["git", "apply", "--3way"],
-            cwd=str(self.repo_root),
-            input=diff,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-        )
+            # Apply the diff to main repository using git apply
+            # This applies the patch without committing
 
-        if result.returncode != 0:
-            # Try without 3-way
+            # A plain apply is all-or-nothing, so it doubles as the check:
+            # a patch made against the same HEAD applies cleanly in one go
+            patch.seek(0)
             result = subprocess.run(
                 ["git", "apply"],
                 cwd=str(self.repo_root),
-                input=diff,
+                stdin=patch,
                 capture_output=True,
                 text=True,
                 encoding="utf-8",
+                close_fds=CLOSE_FDS,
             )
 
             if result.returncode != 0:
-                # If patch still fails, try copying files directly
-                logger.warning(
-                    f"git apply failed: {result.stderr}, trying direct file copy"
+                # Salvage with a 3-way merge against the patch's base blobs
+                patch.seek(0)
+                result = subprocess.run(
+                    ["git", "apply", "--3way"],
+                    cwd=str(self.repo_root),
+                    stdin=patch,
+                    capture_output=True,
+                    text=True,
+                    encoding="utf-8",
+                    close_fds=CLOSE_FDS,
                 )
-                return self._copy_changed_files(member_id)
+
+        if result.returncode != 0:
+            # If patch still fails, try copying files directly
+            logger.warning(
+                f"git apply failed: {result.stderr}, trying direct file copy"
+            )
+            return self._copy_changed_files(member_id)
 
         logger.success(f"Applied changes from {member_id} (unstaged)")
         return True
@@ -353,76 +591,171 @@ class WorktreeManager:
         """
         worktree_path = self.worktrees_dir / member_id
 
-        # Get list of changed files
+        # Get list of changed files with their status, NUL-separated so any
+        # path parses: ":<modes> <oids> <status>" then one path (two for
+        # renames and copies)
         returncode, stdout, stderr = self._run_git_command(
-            ["diff", "--name-only", "HEAD"], cwd=worktree_path
+            ["diff", "--raw", "-z", "HEAD"], cwd=worktree_path, as_bytes=True
         )
 
         if returncode != 0:
-            raise RuntimeError(f"Failed to get changed files: {stderr}")
+            raise RuntimeError(
+                f"Failed to get changed files: {stderr.decode('utf-8', 'replace')}"
+            )
 
-        changed_files = [f.strip() for f in stdout.strip().split("\n") if f.strip()]
+        fields = iter(stdout.split(b"\0"))
+        removed = []
+        changed_files = []
+        for meta in fields:
+            if not meta.startswith(b":"):
+                continue
+            status = meta.split()[-1][:1]
+            path = os.fsdecode(next(fields))
+            if status in (b"R", b"C"):
+                if status == b"R":
+                    removed.append(path)
+                path = os.fsdecode(next(fields))
+            if status == b"D":
+                removed.append(path)
+            else:
+                changed_files.append(path)
 
-        if not changed_files:
+        if not changed_files and not removed:
             return False
 
+        # Delete removed files (including rename sources)
+        for file_path in removed:
+            dst = self.repo_root / file_path
+            try:
+                dst.unlink()
+            except FileNotFoundError:
+                continue
+            logger.info(f"  Deleted: {file_path}")
+
         # Copy each changed file
         for file_path in changed_files:
-            src = worktree_path / file_path
             dst = self.repo_root / file_path
-
-            if src.exists():
-                # Ensure parent directory exists
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                # Copy file content
-                shutil.copy2(src, dst)
-                logger.info(f"  Copied: {file_path}")
-            else:
-                # File was deleted
-                if dst.exists():
-                    dst.unlink()
-                    logger.info(f"  Deleted: {file_path}")
-
-        logger.success(f"Copied {len(changed_files)} changed file(s) from {member_id}")
+            # Ensure parent directory exists
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            # Copy file content
+            _copy_file_content(worktree_path / file_path, dst)
+            logger.info(f"  Copied: {file_path}")
+
+        logger.success(
+            f"Copied {len(changed_files) + len(removed)} changed file(s) from {member_id}"
+        )
         return True
 
     def cleanup_all_worktrees(self):
         """Remove all worktrees, associated branches, and clean up."""
-        # List all worktrees
-        returncode, stdout, stderr = self._run_git_command(["worktree", "list"])
+        # List all worktrees (NUL-separated fields, so any path parses)
+        returncode, stdout, stderr = self._run_git_command(
+            ["worktree", "list", "--porcelain", "-z"]
+        )
+        separator = "\0"
+        if returncode != 0:
+            # git < 2.36 has no -z for worktree list
+            returncode, stdout, stderr = self._run_git_command(
+                ["worktree", "list", "--porcelain"]
+            )
+            separator = "\n"
 
         if returncode == 0:
             # Parse worktree list and remove non-main worktrees
-            for line in stdout.split("\n"):
-                if line and str(self.worktrees_dir) in line:
-                    # Extract path
-                    parts = line.split()
-                    path = parts[0]
-                    member_id = Path(path).name
-
-                    try:
-                        self.remove_worktree(member_id, force=True)
-                    except Exception:
-                        pass
-
-        # Clean up any remaining directories
-        if self.worktrees_dir.exists():
-            for item in self.worktrees_dir.iterdir():
-                if item.is_dir():
-                    shutil.rmtree(item, ignore_errors=True)
+            member_ids = []
+            for field in stdout.split(separator):
+                if field.startswith("worktree "):
+                    path = field[len("worktree ") :]
+                    if str(self.worktrees_dir) in path:
+                        member_ids.append(Path(path).name)
+
+            if member_ids:
+                with ThreadPoolExecutor(
+                    max_workers=self._worker_count(len(member_ids))
+                ) as executor:
+                    futures = [
+                        executor.submit(self.remove_worktree, member_id, True)
+                        for member_id in member_ids
+                    ]
+                    for future in futures:
+                        try:
+                            future.result()
+                        except Exception:
+                            pass
+
+        # Clean up any remaining directories (d_type from scandir, no stat)
+        try:
+            with os.scandir(self.worktrees_dir) as entries:
+                leftovers = [
+                    entry.path for entry in entries if entry.is_dir(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            leftovers = []
+
+        if leftovers:
+            with ThreadPoolExecutor(
+                max_workers=self._worker_count(len(leftovers))
+            ) as executor:
+                for path in leftovers:
+                    executor.submit(shutil.rmtree, path, ignore_errors=True)
 
         # Prune worktree references
         self._run_git_command(["worktree", "prune"])
 
-        # Delete all council/* branches
+        # Delete all council/* branches in one ref transaction, fed over
+        # stdin so the number of branches can't overflow the command line
         returncode, stdout, stderr = self._run_git_command(
-            ["branch", "--list", "council/*"]
+            ["for-each-ref", "--format=%(refname)", "refs/heads/council/"],
+            as_bytes=True,
         )
-        if returncode == 0 and stdout.strip():
-            for line in stdout.strip().split("\n"):
-                branch = line.strip().lstrip("* ")
-                if branch:
-                    self._run_git_command(["branch", "-D", branch])
+        if returncode == 0:
+            # Unlike `branch -D`, update-ref deletes checked-out branches too,
+            # which would leave that HEAD unborn; keep those
+            checked_out = self._checked_out_refs()
+            refs = [ref for ref in stdout.split() if ref not in checked_out]
+            if refs:
+                result = subprocess.run(
+                    ["git", "update-ref", "--stdin", "-z"],
+                    cwd=str(self.repo_root),
+                    input=b"".join(b"delete " + ref + b"\0\0" for ref in refs),
+                    capture_output=True,
+                    close_fds=CLOSE_FDS,
+                )
+                if result.returncode != 0:
+                    logger.warning(
+                        "Failed to delete council branches: {}",
+                        result.stderr.decode("utf-8", "replace").strip(),
+                    )
+
+    def _checked_out_refs(self) -> Set[bytes]:
+        """
+        Get the branch refs checked out in the main repo or any worktree.
+
+        Returns:
+            Set of full ref names (bytes), e.g. b"refs/heads/main"
+        """
+        refs = set()
+
+        returncode, stdout, stderr = self._run_git_command(
+            ["symbolic-ref", "-q", "HEAD"], as_bytes=True
+        )
+        if returncode == 0:
+            refs.add(stdout.strip())
+
+        returncode, stdout, stderr = self._run_git_command(
+            ["worktree", "list", "--porcelain", "-z"], as_bytes=True
+        )
+        if returncode != 0:
+            # git < 2.36 has no -z for worktree list
+            returncode, stdout, stderr = self._run_git_command(
+                ["worktree", "list", "--porcelain"], as_bytes=True
+            )
+        if returncode == 0:
+            for field in stdout.replace(b"\n", b"\0").split(b"\0"):
+                if field.startswith(b"branch "):
+                    refs.add(field[len(b"branch ") :])
+
+        return refs
 
     def prepare_fresh_worktrees(self):
         """
@@ -452,11 +785,4 @@ class WorktreeManager:
             current_branch = current_branch.strip()
             # If not on main/master, try to switch
             if current_branch not in ("main", "master"):
-                self._run_git_command(["checkout", "main"])
-                if (
-                    self._run_git_command(["rev-parse", "--abbrev-ref", "HEAD"])[
-                        1
-                    ].strip()
-                    != "main"
-                ):
-                    self._run_git_command(["checkout", "master"])
+                self._run_git_command(["checkout", self._get_main_branch()])